@@ -177,35 +177,39 @@ class GitHubIssueCreator:
         if "milestones" in plan:
             print("\nCreating milestones...")
             for milestone_data in plan["milestones"]:
+                title = milestone_data["title"]
+                if title in milestone_map:
+                    continue
                 milestone_number = self.create_milestone(
-                    milestone_data["title"],
+                    title,
                     milestone_data["description"],
                     milestone_data.get("due_on"),
                 )
                 if milestone_number:
-                    milestone_map[milestone_data["title"]] = milestone_number
+                    milestone_map[title] = milestone_number
 
         # Create issues
         if "issues" in plan:
             print(f"\nCreating {len(plan['issues'])} issues...")
             for issue_data in plan["issues"]:
+                get = issue_data.get
                 # Convert dict to Issue object
                 issue = Issue(
                     title=issue_data["title"],
                     body=issue_data["body"],
-                    labels=issue_data.get("labels", []),
-                    milestone=issue_data.get("milestone"),
-                    assignees=issue_data.get("assignees"),
-                    epic_parent=issue_data.get("epic_parent"),
-                    story_points=issue_data.get("story_points"),
-                    acceptance_criteria=issue_data.get("acceptance_criteria"),
-                    agent_role=issue_data.get("agent_role"),
-                    verification_required=issue_data.get("verification_required", True),
+                    labels=get("labels", []),
+                    milestone=get("milestone"),
+                    assignees=get("assignees"),
+                    epic_parent=get("epic_parent"),
+                    story_points=get("story_points"),
+                    acceptance_criteria=get("acceptance_criteria"),
+                    agent_role=get("agent_role"),
+                    verification_required=get("verification_required", True),
                 )
 
-                milestone_number = None
-                if issue.milestone and issue.milestone in milestone_map:
-                    milestone_number = milestone_map[issue.milestone]
+                milestone_number = (
+                    milestone_map.get(issue.milestone) if issue.milestone else None
+                )
 
                 self.create_issue(issue, milestone_number)
 
@@ -37,6 +37,7 @@ def create_app(
     """Return a FastAPI app wired with core managers."""
 
     task_manager = TaskManager.__new__(TaskManager)
+    task_manager._init_state()
     task_manager.issue_manager = issue_manager
     issue_manager.on_change = task_manager._trigger_sync
     from ..tasks.pinned_items import PinnedItemsStore
@@ -50,7 +51,6 @@ def create_app(
 
     task_manager.config = WorkflowConfig()
     task_manager.sync_cooldown = task_manager.config.hierarchy_sync_cooldown
-    task_manager._last_sync = 0.0
     task_manager.audit_logger = audit_logger
     backlog_doctor = BacklogDoctor(issue_manager)
     audit_logger = audit_logger or AuditLogger(Path("audit.log"))
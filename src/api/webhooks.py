@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import hashlib
+import codecs
 import hmac
 import json
 import logging
+import os
 import time
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +15,22 @@ from fastapi import APIRouter, Header, HTTPException, Request
 from ..audit.logger import AuditLogger
 from ..tasks.task_manager import TaskManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _is_plain_utf8(body: bytes) -> bool:
+    # UTF-8 JSON never contains a raw NUL, while UTF-16/32 text always does
+    if body.startswith(codecs.BOM_UTF8) or b"\x00" in body:
+        return False
+    try:
+        body.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+    return True
+
 
 class OverrideStore:
     """Simple append-only storage for webhook overrides."""
@@ -28,8 +45,46 @@ class OverrideStore:
             "payload": payload,
             "timestamp": datetime.utcnow().isoformat(),
         }
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        if orjson is not None:
+            self._append(orjson.dumps(entry) + b"\n")
+        else:
+            self._append((json.dumps(entry) + "\n").encode())
+
+    def add_raw(self, event: str, body: bytes, payload: Any) -> None:
+        """Append ``body``, the request bytes ``payload`` was decoded from.
+
+        Plain UTF-8 bodies are embedded as-is rather than re-serialized. JSON
+        only allows raw line breaks as whitespace, so they are flattened to
+        keep one entry per line. Other encodings the JSON decoder accepts
+        (UTF-16/32, a UTF-8 BOM) go through :meth:`add`.
+        """
+        if not _is_plain_utf8(body):
+            self.add(event, payload)
+            return
+        raw = body.strip().replace(b"\r", b" ").replace(b"\n", b" ")
+        timestamp = json.dumps(datetime.utcnow().isoformat())
+        line = b"".join(
+            (
+                b'{"event": ',
+                json.dumps(event).encode(),
+                b', "payload": ',
+                raw,
+                b', "timestamp": ',
+                timestamp.encode(),
+                b"}\n",
+            )
+        )
+        self._append(line)
+
+    def _append(self, line: bytes) -> None:
+        # A single unbuffered write on an O_APPEND descriptor keeps each entry
+        # intact even when several workers share the file. The file is
+        # reopened per entry so rotated logs are picked up.
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
 
 
 class RateLimiter:
@@ -49,15 +104,29 @@ class RateLimiter:
         return True
 
 
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
 def verify_signature(secret: str, body: bytes, signature: str | None) -> bool:
     """Return True if signature matches the body using ``secret``."""
     if not secret:
         return True
     if not signature:
         return False
-    mac = hmac.new(secret.encode(), msg=body, digestmod=hashlib.sha256)
-    expected = "sha256=" + mac.hexdigest()
-    return hmac.compare_digest(expected, signature)
+    prefix, _, hexdigest = signature.partition("=")
+    # bytes.fromhex() also accepts whitespace and uppercase; keep the old
+    # exact-match acceptance set of 64 lowercase hex digits
+    if (
+        prefix != "sha256"
+        or len(hexdigest) != 64
+        or not _HEX_DIGITS.issuperset(hexdigest)
+    ):
+        return False
+    provided = bytes.fromhex(hexdigest)
+    # One-shot ``hmac.digest`` skips building a Python-level HMAC object, and
+    # comparing raw digests avoids hex-encoding the expected value
+    expected = hmac.digest(secret.encode(), body, "sha256")
+    return hmac.compare_digest(expected, provided)
 
 
 def create_webhook_router(
@@ -91,7 +160,7 @@ def create_webhook_router(
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid payload")
         event = x_github_event or "unknown"
-        store.add(event, payload)
+        store.add_raw(event, body, payload)
         if audit_logger:
             audit_logger.log("github_webhook", {"event": event})
         logger.info("GitHub webhook received: %s", event)
@@ -100,7 +169,7 @@ def create_webhook_router(
             and event == "issues"
             and payload.get("action") in {"edited", "labeled", "unlabeled"}
         ):
-            task_manager._trigger_sync()
+            task_manager._trigger_sync(f"webhook:{event}")
         return {"success": True}
 
     @router.post("/webhook/overrides")
@@ -112,12 +181,13 @@ def create_webhook_router(
             payload = await request.json()
         except Exception:
             raise HTTPException(status_code=400, detail="Invalid payload")
+        # Unauthenticated input is always re-encoded rather than stored raw
         store.add("override", payload)
         if audit_logger:
             audit_logger.log("manual_override", payload)
         logger.info("Override webhook received")
         if task_manager:
-            task_manager._trigger_sync()
+            task_manager._trigger_sync("webhook:override")
         return {"success": True}
 
     return router
@@ -1,8 +1,67 @@
+import functools
+import hashlib
+import io
 import json
+import time
 from datetime import datetime, timedelta
-from hashlib import sha1
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# ``orjson.JSONDecodeError`` subclasses the stdlib error, so one handler works
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _parse_lines(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield decoded JSON lines, skipping blank and malformed ones."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield _loads(line)
+        except json.JSONDecodeError:
+            continue
+
+
+def _ttl_cached(func):
+    """Cache a log counter per arguments for ``count_cache_ttl`` seconds."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self.count_cache_ttl <= 0:
+            return func(self, *args, **kwargs)
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        cached = self._count_cache.get(key)
+        if cached and now - cached[0] < self.count_cache_ttl:
+            return cached[1]
+        value = func(self, *args, **kwargs)
+        self._count_cache[key] = (now, value)
+        return value
+
+    return wrapper
+
+
+def _hash_factory(name: str) -> Callable[[bytes], Any]:
+    """Return a constructor for the ``name`` hash algorithm."""
+    if name == "blake3":
+        if blake3 is None:
+            raise ValueError("blake3 hasher requires the 'blake3' package")
+        return blake3.blake3
+    if name in hashlib.algorithms_guaranteed:
+        return getattr(hashlib, name)
+    hashlib.new(name)  # raises ValueError for unsupported algorithms
+    return functools.partial(hashlib.new, name)
 
 
 class AuditLogger:
@@ -11,29 +70,55 @@ class AuditLogger:
     Parameters
     ----------
     log_path:
-        Path to the audit log file.
+        Path to the audit log file, or a text stream such as
+        :class:`io.StringIO` to keep entries in memory. Stream logs cannot
+        be combined with ``use_git`` and have no default ``overrides_path``.
     use_git:
         If ``True`` the logger will commit updates to ``log_path`` using Git.
+    count_cache_ttl:
+        Seconds to reuse results of the ``count_*`` helpers; ``0`` (the
+        default) disables caching. Entries written through this instance's
+        :meth:`log` invalidate the cache immediately, but writes from other
+        loggers or processes stay unseen until the TTL expires.
+    hasher:
+        Algorithm used for the entry ``hash`` and ``diff_hash`` values. The
+        default ``"sha1"`` keeps hashes compatible with existing logs; new
+        deployments may choose ``"blake2b"`` or ``"blake3"``.
     """
 
     def __init__(
         self,
-        log_path: Path,
+        log_path: Path | TextIO,
         use_git: bool = False,
         *,
         overrides_path: Path | None = None,
+        count_cache_ttl: float = 0.0,
+        hasher: str = "sha1",
     ) -> None:
-        self.log_path = Path(log_path)
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.log_path.exists():
-            self.log_path.touch()
-        self.overrides_path = (
-            Path(overrides_path)
-            if overrides_path is not None
-            else self.log_path.with_name("overrides.log")
-        )
+        self._stream: Optional[TextIO] = None
+        self.log_path: Optional[Path] = None
+        self.repo_path: Optional[Path] = None
+        if isinstance(log_path, io.TextIOBase):
+            if use_git:
+                raise ValueError("use_git requires a file log_path")
+            self._stream = log_path
+        else:
+            self.log_path = Path(log_path)
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            if not self.log_path.exists():
+                self.log_path.touch()
+            self.repo_path = self.log_path.parent
+        if overrides_path is not None:
+            self.overrides_path: Optional[Path] = Path(overrides_path)
+        elif self.log_path is not None:
+            self.overrides_path = self.log_path.with_name("overrides.log")
+        else:
+            self.overrides_path = None
         self.use_git = use_git
-        self.repo_path = self.log_path.parent
+        self.count_cache_ttl = count_cache_ttl
+        self.hasher = hasher
+        self._hash = _hash_factory(hasher)
+        self._count_cache: Dict[Tuple[Any, ...], Tuple[float, int]] = {}
         if self.use_git:
             self._ensure_repo()
 
@@ -50,40 +135,57 @@ class AuditLogger:
             "timestamp": datetime.utcnow().isoformat(),
         }
 
-        diff_hash = sha1(json.dumps(details, sort_keys=True).encode()).hexdigest()[:8]
+        diff_hash = self._digest(details)
         payload["diff_hash"] = diff_hash
 
-        digest = sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:8]
+        digest = self._digest(payload)
         payload["hash"] = digest
-        with self.log_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload) + "\n")
+        line = json.dumps(payload) + "\n"
+        if self._stream is not None:
+            self._stream.write(line)
+        else:
+            with self.log_path.open("a", encoding="utf-8") as f:
+                f.write(line)
+        self._count_cache.clear()
         if self.use_git:
             message = f"audit: {payload['hash']} {operation}"
             self._git_commit(message)
         return digest
 
+    def _digest(self, data: Dict[str, Any]) -> str:
+        return self._hash(json.dumps(data, sort_keys=True).encode()).hexdigest()[:8]
+
     def iter_logs(self):
         """Yield log entries as dictionaries."""
+        if self._stream is not None:
+            self._stream.seek(0)
+            yield from _parse_lines(self._stream.read().splitlines())
+            return
         if not self.log_path.exists():
             return
         with self.log_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    yield json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+            yield from _parse_lines(f)
+
+    def clear(self) -> None:
+        """Truncate the log, e.g. to reuse one logger across independent runs."""
+        if self._stream is not None:
+            self._stream.seek(0)
+            self._stream.truncate()
+        else:
+            with self.log_path.open("w", encoding="utf-8"):
+                pass
+        self._count_cache.clear()
 
     # ------------------------------------------------------------------
     def count_human_overrides(self) -> int:
         """Return the number of manual override events."""
-        if not self.overrides_path.exists():
+        if self.overrides_path is None or not self.overrides_path.exists():
             return 0
-        with self.overrides_path.open("r", encoding="utf-8") as f:
-            return sum(1 for line in f if line.strip())
+        # Counted on raw bytes: entries need no decoding to be counted
+        with self.overrides_path.open("rb") as f:
+            return sum(1 for line in f if not line.isspace())
 
+    @_ttl_cached
     def count_command_usage(self, cmd: str) -> int:
         """Return count of tool executions matching ``cmd``."""
         count = 0
@@ -94,6 +196,7 @@ class AuditLogger:
                     count += 1
         return count
 
+    @_ttl_cached
     def count_ai_recommendations(self, days: int = 7) -> int:
         """Return count of automated actions in the last ``days``."""
         cutoff = datetime.utcnow() - timedelta(days=days)
@@ -109,6 +212,7 @@ class AuditLogger:
                     count += 1
         return count
 
+    @_ttl_cached
     def count_approvals(self, days: int = 7) -> int:
         """Return count of successful automated actions in ``days``."""
         cutoff = datetime.utcnow() - timedelta(days=days)
@@ -124,6 +228,7 @@ class AuditLogger:
                     count += 1
         return count
 
+    @_ttl_cached
     def count_undo_operations(self, days: int = 7) -> int:
         """Return number of undo events in ``days``."""
         cutoff = datetime.utcnow() - timedelta(days=days)
@@ -139,6 +244,7 @@ class AuditLogger:
                     cnt += 1
         return cnt
 
+    @_ttl_cached
     def weekly_active_users(self, days: int = 7) -> int:
         """Return count of unique agents who executed tools in ``days``."""
         cutoff = datetime.utcnow() - timedelta(days=days)
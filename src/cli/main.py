@@ -8,7 +8,7 @@ import shlex
 import sys
 import webbrowser
 from pathlib import Path
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 
 from ..core.errors import handle_errors
 
@@ -646,15 +646,13 @@ def cmd_init(manager: WorkflowManager, args) -> int:
     # Setup repository first
     manager.setup_repository()
 
-    # Create template-specific files
-    if args.template == "web":
-        _create_web_template(manager.workspace_path)
-    elif args.template == "api":
-        _create_api_template(manager.workspace_path)
-    elif args.template == "cli":
-        _create_cli_template(manager.workspace_path)
-    else:  # library
-        _create_library_template(manager.workspace_path)
+    # Create template-specific files; unknown templates fall back to library
+    templates = {
+        "web": _create_web_template,
+        "api": _create_api_template,
+        "cli": _create_cli_template,
+    }
+    templates.get(args.template, _create_library_template)(manager.workspace_path)
 
     print("✓ Project initialized successfully")
     print(f"  Template: {args.template}")
@@ -1498,6 +1496,33 @@ def cmd_configure(args) -> int:
         return 1
 
 
+# Static project template data shared by every ``init`` invocation
+_WEB_SCRIPTS = MappingProxyType(
+    {
+        "start": "npm run dev",
+        "dev": "vite",
+        "build": "vite build",
+        "test": "vitest",
+        "test:coverage": "vitest --coverage",
+    }
+)
+_WEB_DEV_DEPENDENCIES = MappingProxyType(
+    {
+        "vite": "^4.0.0",
+        "vitest": "^0.28.0",
+        "@vitejs/plugin-react": "^3.0.0",
+    }
+)
+_API_REQUIREMENTS = (
+    "fastapi>=0.68.0",
+    "uvicorn[standard]>=0.15.0",
+    "pydantic>=1.8.0",
+    "pytest>=6.0.0",
+    "pytest-asyncio>=0.18.0",
+    "httpx>=0.24.0",
+)
+
+
 def _create_web_template(workspace_path: Path) -> None:
     """Create web application template"""
     # Create basic web app structure
@@ -1509,18 +1534,8 @@ def _create_web_template(workspace_path: Path) -> None:
     package_json = {
         "name": workspace_path.name,
         "version": "0.1.0",
-        "scripts": {
-            "start": "npm run dev",
-            "dev": "vite",
-            "build": "vite build",
-            "test": "vitest",
-            "test:coverage": "vitest --coverage",
-        },
-        "devDependencies": {
-            "vite": "^4.0.0",
-            "vitest": "^0.28.0",
-            "@vitejs/plugin-react": "^3.0.0",
-        },
+        "scripts": dict(_WEB_SCRIPTS),
+        "devDependencies": dict(_WEB_DEV_DEPENDENCIES),
     }
 
     import json
@@ -1535,17 +1550,8 @@ def _create_api_template(workspace_path: Path) -> None:
     (workspace_path / "tests").mkdir(exist_ok=True)
 
     # Create requirements.txt
-    requirements = [
-        "fastapi>=0.68.0",
-        "uvicorn[standard]>=0.15.0",
-        "pydantic>=1.8.0",
-        "pytest>=6.0.0",
-        "pytest-asyncio>=0.18.0",
-        "httpx>=0.24.0",
-    ]
-
     with open(workspace_path / "requirements.txt", "w") as f:
-        f.write("\n".join(requirements))
+        f.write("\n".join(_API_REQUIREMENTS))
 
 
 def _create_cli_template(workspace_path: Path) -> None:
@@ -64,6 +64,12 @@ class WorkflowConfig:
     hierarchy_orphan_threshold: int = 3
     hierarchy_sync_cooldown: int = 60
 
+    # Seconds open issues fetched for task ranking are reused
+    issues_cache_ttl: int = 30
+
+    # Threads used to score tasks; 1 keeps scoring sequential
+    ranking_max_workers: int = 1
+
     # ------------------------------------------------------------------
     @classmethod
     def from_yaml(cls, path: Path) -> "WorkflowConfig":
@@ -136,6 +142,12 @@ class WorkflowConfig:
         if self.hierarchy_sync_cooldown <= 0:
             raise ValueError("hierarchy_sync_cooldown must be positive")
 
+        if self.issues_cache_ttl < 0:
+            raise ValueError("issues_cache_ttl must not be negative")
+
+        if self.ranking_max_workers <= 0:
+            raise ValueError("ranking_max_workers must be positive")
+
         if self.commit_window <= 0:
             raise ValueError("commit_window must be positive")
 
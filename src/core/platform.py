@@ -88,6 +88,16 @@ class Mem0Client:  # pragma: no cover - uses real Mem0 backend
             repo_store[key] = value
         return True
 
+    def reset(self) -> None:
+        """Forget all stored entries, deleting them from the backend."""
+        for mem_id in self._id_map.values():
+            try:
+                self.backend.delete(mem_id)
+            except Exception:
+                pass
+        self._id_map.clear()
+        self.store.clear()
+
 
 class CachedMem0Client:
     """Lazily initialize ``Mem0Client`` and cache search results."""
@@ -120,6 +130,12 @@ class CachedMem0Client:
         self._cache.clear()
         return self.client.add(data)
 
+    def reset(self) -> None:
+        """Drop cached results and every stored entry."""
+        self._cache.clear()
+        if self._client is not None:
+            self._client.reset()
+
 
 class AutonomyPlatform:
     """Shared foundation for all workflows."""
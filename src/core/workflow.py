@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
 
 from .models import WorkflowResult, WorkflowState
 
@@ -8,7 +9,15 @@ StateGraph = Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]]
 
 
 class BaseWorkflow:
-    """Minimal workflow with sequential step execution."""
+    """Minimal workflow executing steps in graph order.
+
+    Subclasses may declare ``STEP_DEPS`` mapping a step name to the steps it
+    depends on. Steps whose dependencies have completed then run concurrently;
+    steps missing from the mapping depend on every step before them.
+    """
+
+    STEP_DEPS: Dict[str, Tuple[str, ...]] = {}
+    MAX_WORKERS = 4
 
     def __init__(self, memory, llm, github, slack):
         self.memory = memory
@@ -21,9 +30,49 @@ class BaseWorkflow:
     def _build_graph(self) -> StateGraph:  # pragma: no cover - abstract
         raise NotImplementedError
 
+    def _step_waves(self) -> List[List[str]]:
+        """Group steps into waves whose members do not depend on each other."""
+        order = list(self.graph)
+        deps = {
+            name: [
+                d for d in self.STEP_DEPS.get(name, tuple(order[:i])) if d in self.graph
+            ]
+            for i, name in enumerate(order)
+        }
+        waves: List[List[str]] = []
+        done: set[str] = set()
+        pending = order
+        while pending:
+            ready = [n for n in pending if all(d in done for d in deps[n])]
+            if not ready:
+                raise ValueError(f"Cyclic step dependencies: {pending}")
+            waves.append(ready)
+            done.update(ready)
+            pending = [n for n in pending if n not in done]
+        return waves
+
     # ------------------------------------------------------------------
     def execute(self, state: Dict[str, Any]) -> WorkflowResult:
         current = state.copy()
-        for step, func in self.graph.items():
-            current = func(current)
+        if not self.STEP_DEPS:
+            for step, func in self.graph.items():
+                current = func(current)
+            return WorkflowResult(success=True, state=WorkflowState(data=current))
+
+        for wave in self._step_waves():
+            if len(wave) == 1:
+                current = self.graph[wave[0]](current)
+                continue
+            workers = min(len(wave), self.MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(self.graph[n], current.copy()) for n in wave]
+                results = [f.result() for f in futures]
+            merged = current.copy()
+            for result in results:
+                merged.update(
+                    (k, v)
+                    for k, v in result.items()
+                    if k not in current or current[k] is not v
+                )
+            current = merged
         return WorkflowResult(success=True, state=WorkflowState(data=current))
@@ -182,8 +182,15 @@ class BoardManager:
         nodes = data.get("node", {}).get("options", {}).get("nodes", [])
         return {n.get("name") for n in nodes if n.get("name")}
 
-    def _ensure_options(self, field_id: str, options: Iterable[str]) -> None:
-        existing = self._get_field_options(field_id)
+    def _ensure_options(
+        self,
+        field_id: str,
+        options: Iterable[str],
+        *,
+        existing: Optional[set[str]] = None,
+    ) -> None:
+        if existing is None:
+            existing = self._get_field_options(field_id)
         for opt in options:
             if opt not in existing:
                 self._add_option(field_id, opt)
@@ -197,11 +204,14 @@ class BoardManager:
         cache.update({k: v for k, v in existing.items() if k in self.REQUIRED_FIELDS})
         for name, (ftype, options) in self.REQUIRED_FIELDS.items():
             field_id = existing.get(name)
+            known_options: Optional[set[str]] = None
             if not field_id:
                 field_id = self._create_field(project_id, name, ftype)
                 cache[name] = field_id
+                # A freshly created field has no options yet
+                known_options = set()
             if options and ftype == "SINGLE_SELECT":
-                self._ensure_options(field_id, options)
+                self._ensure_options(field_id, options, existing=known_options)
         self._save_cache(cache)
         return cache
 
@@ -7,9 +7,9 @@ Supports the Generate-Verify loop workflow with PM-agent, SDE-agent, and QA-agen
 
 import argparse
 import asyncio
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 import requests
@@ -19,8 +19,21 @@ try:
 except ImportError:
     yaml = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _json_body(response: Any) -> Any:
+    """Decode a JSON response body, using ``orjson`` when it is installed."""
+    content = getattr(response, "content", None)
+    if orjson is not None and isinstance(content, bytes):
+        return orjson.loads(content)
+    return response.json()
+
+
+@dataclass(frozen=True)
 class Label:
     """GitHub label definition"""
 
@@ -28,8 +41,12 @@ class Label:
     color: str
     description: str
 
+    def to_dict(self) -> Dict[str, str]:
+        """Return the label as an API payload"""
+        return {"name": self.name, "color": self.color, "description": self.description}
 
-@dataclass
+
+@dataclass(frozen=True)
 class Milestone:
     """GitHub milestone definition"""
 
@@ -38,6 +55,15 @@ class Milestone:
     due_on: Optional[str] = None
     state: str = "open"
 
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """Return the milestone as an API payload"""
+        return {
+            "title": self.title,
+            "description": self.description,
+            "due_on": self.due_on,
+            "state": self.state,
+        }
+
 
 @dataclass
 class Issue:
@@ -124,7 +150,9 @@ class IssueManager:
             try:
                 sess = self.session or requests
                 response = sess.post(
-                    f"{self.base_url}/labels", headers=self.headers, json=asdict(label)
+                    f"{self.base_url}/labels",
+                    headers=self.headers,
+                    json=label.to_dict(),
                 )
 
                 if response.status_code == 201:
@@ -146,7 +174,7 @@ class IssueManager:
     def create_milestone(self, milestone: Milestone) -> Optional[int]:
         """Create a milestone and return its number"""
         try:
-            milestone_dict = asdict(milestone)
+            milestone_dict = milestone.to_dict()
             sess = self.session or requests
             response = sess.post(
                 f"{self.base_url}/milestones", headers=self.headers, json=milestone_dict
@@ -250,11 +278,33 @@ class IssueManager:
                 params={"state": state},
             )
             if response.status_code == 200:
-                return response.json()
+                return _json_body(response)
         except Exception:
             pass
         return []
 
+    def list_issues_conditional(
+        self, state: str = "open", etag: Optional[str] = None
+    ) -> Tuple[int, Optional[str], List[Dict[str, Any]]]:
+        """Return ``(status, etag, issues)`` revalidating with ``etag``.
+
+        A ``304`` status means the issues are unchanged since ``etag`` was
+        issued and no body is returned.
+        """
+        headers = dict(self.headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        try:
+            sess = self.session or requests
+            response = sess.get(
+                f"{self.base_url}/issues", headers=headers, params={"state": state}
+            )
+            if response.status_code == 200:
+                return 200, response.headers.get("ETag"), _json_body(response)
+            return response.status_code, etag, []
+        except Exception:
+            return 0, None, []
+
     def get_issue(self, issue_number: int) -> Optional[Dict[str, Any]]:
         """Return a single issue if found."""
         try:
@@ -317,19 +367,25 @@ class IssueManager:
         add_labels: Optional[List[str]] = None,
         remove_labels: Optional[List[str]] = None,
     ) -> bool:
-        """Add and remove labels on an issue."""
+        """Add and remove labels on an issue.
+
+        Returns ``True`` without a request when the edit leaves the labels
+        unchanged.
+        """
         issue = self.get_issue(issue_number)
         if not issue:
             return False
-        labels = [
+        current = [
             label["name"] if isinstance(label, dict) and "name" in label else label
             for label in issue.get("labels", [])
         ]
-        if add_labels:
-            labels.extend(add_labels)
+        labels = current + list(add_labels or ())
         if remove_labels:
-            labels = [label for label in labels if label not in remove_labels]
+            removed = frozenset(remove_labels)
+            labels = [label for label in labels if label not in removed]
         labels = list(dict.fromkeys(labels))
+        if frozenset(labels) == frozenset(current):
+            return True
         try:
             sess = self.session or requests
             response = sess.patch(
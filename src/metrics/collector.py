@@ -1,16 +1,51 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
 from ..audit.logger import AuditLogger
 from ..slack.bot import SlackBot
 from .storage import MetricsStorage
 
+if TYPE_CHECKING:
+    from ..tasks.hierarchy_manager import HierarchyManager
+
+
+def _zero() -> int:
+    return 0
+
+
+_REPORT_TEMPLATE = (
+    "📊 **Daily Team Metrics** - {repository}\n\n"
+    "**🎯 Planning Efficiency**\n"
+    "• Time to task assignment: {time_to_task_avg:.1f} hours\n"
+    "• AI approval rate: {approval_rate:.1f}%\n"
+    "• Sprint completion: {sprint_completion_rate:.1f}%\n\n"
+    "**👥 Team Activity**\n"
+    "• Weekly active users: {weekly_active_users} team members\n"
+    "• Planning commands used: {planning_commands_used} today\n"
+    "• Human overrides: {human_overrides_count} (learning opportunities)\n"
+    "• Undo rate: {undo_rate:.1f}%\n\n"
+    "**📈 Development Velocity**\n"
+    "• LOC per assignee: {loc_per_assignee} avg\n"
+    "• Open issues: {open_issues_count}\n"
+    "• Orphan issues: {orphan_issues_count}\n\n"
+    "💡 Use `/autonomy status` for detailed metrics"
+)
+
 
 class MetricsCollector:
     """Collect basic team metrics and generate Slack reports."""
 
+    MAX_WORKERS = 8
+    TREE_TTL = 60
+
     def __init__(
         self,
         github_client: Any,
@@ -22,18 +57,78 @@ class MetricsCollector:
         self.slack = slack_client
         self.audit = audit_logger
         self.storage = storage
+        # Optional GitHub client capabilities, resolved once
+        self._time_to_task = getattr(github_client, "calculate_time_to_task", _zero)
+        self._github_wau = getattr(github_client, "weekly_active_users", _zero)
+        self._loc_per_assignee = getattr(
+            github_client, "calculate_loc_per_assignee", _zero
+        )
+        self._sprint_completion = getattr(
+            github_client, "calculate_sprint_completion", _zero
+        )
+        self._daily_cache: Dict[Tuple[str, date], str] = {}
+        self._cache_lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, date], threading.Lock] = {}
+        self._tree_cache: Tuple[float, Dict[int, Any]] | None = None
 
     # ------------------------------------------------------------------
-    def collect_daily_metrics(self, repository: str) -> str:
-        """Collect metrics, store them and return a Slack report."""
-        prev = self.storage.get_latest_metrics(repository)
-        curr_wau = self.calculate_wau()
-        curr_approval = self.calculate_approval_rate()
-        curr_orphans = self.calculate_orphan_count()
+    def collect_daily_metrics(self, repository: str, *, force: bool = False) -> str:
+        """Collect metrics, store them and return a Slack report.
+
+        Reports are cached per repository and day; pass ``force=True`` to
+        recompute and re-store them. An empty string is returned, and nothing
+        stored, when the metrics match the latest stored report.
+        """
+        today = datetime.now().date()
+        key = (repository, today)
+        with self._cache_lock:
+            if not force and key in self._daily_cache:
+                return self._daily_cache[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # Locked per repository and day so different repositories collect
+        # concurrently while duplicate requests wait for one collection
+        with key_lock:
+            with self._cache_lock:
+                if not force and key in self._daily_cache:
+                    return self._daily_cache[key]
+            report = self._collect(repository, force=force)
+            with self._cache_lock:
+                for stale in [k for k in self._key_locks if k[1] < today]:
+                    self._daily_cache.pop(stale, None)
+                    del self._key_locks[stale]
+                self._daily_cache[key] = report
+            return report
+
+    def _collect(self, repository: str, *, force: bool = False) -> str:
+        # The audit and GitHub lookups are independent I/O, so overlap them.
+        # Each audit counter scans the log and is fetched once per collection.
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            futures = {
+                "prev": pool.submit(self.storage.get_latest_metrics, repository),
+                "total": pool.submit(self.audit.count_ai_recommendations, days=7),
+                "approvals": pool.submit(self.audit.count_approvals, days=7),
+                "overrides": pool.submit(self.audit.count_human_overrides),
+                "undos": pool.submit(self._count_undos),
+                "wau": pool.submit(self.calculate_wau),
+                "orphans": pool.submit(self.calculate_orphan_count),
+                "time_to_task": pool.submit(self.calculate_time_to_task),
+                "loc": pool.submit(self.calculate_loc_per_assignee),
+                "sprint": pool.submit(self.calculate_sprint_completion),
+                "open_issues": pool.submit(
+                    self.github.get_open_issues_count, repository
+                ),
+                "plan_usage": pool.submit(self.audit.count_command_usage, "plan"),
+            }
+            results = {name: fut.result() for name, fut in futures.items()}
+        prev = results["prev"]
+        total = results["total"]
+        curr_wau = results["wau"]
+        curr_approval = self.calculate_approval_rate(results["approvals"], total)
+        curr_orphans = results["orphans"]
         metrics = {
             "date": datetime.now().date(),
             "repository": repository,
-            "time_to_task_avg": self.calculate_time_to_task(),
+            "time_to_task_avg": results["time_to_task"],
             "approval_rate": curr_approval,
             "approval_rate_change_pct": self.calculate_trend(
                 curr_approval, prev.get("approval_rate") if prev else None
@@ -42,68 +137,120 @@ class MetricsCollector:
             "wau_change_pct": self.calculate_trend(
                 curr_wau, prev.get("weekly_active_users") if prev else None
             ),
-            "override_rate": self.calculate_override_rate(),
-            "undo_rate": self.calculate_undo_rate(),
-            "loc_per_assignee": self.calculate_loc_per_assignee(),
-            "sprint_completion_rate": self.calculate_sprint_completion(),
-            "open_issues_count": self.github.get_open_issues_count(repository),
+            "override_rate": self.calculate_override_rate(results["overrides"], total),
+            "undo_rate": self.calculate_undo_rate(results["undos"], total),
+            "loc_per_assignee": results["loc"],
+            "sprint_completion_rate": results["sprint"],
+            "open_issues_count": results["open_issues"],
             "orphan_issues_count": curr_orphans,
             "orphan_issues_change_pct": self.calculate_trend(
                 curr_orphans, prev.get("orphan_issues_count") if prev else None
             ),
-            "planning_commands_used": self.audit.count_command_usage("plan"),
-            "human_overrides_count": self.audit.count_human_overrides(),
+            "planning_commands_used": results["plan_usage"],
+            "human_overrides_count": results["overrides"],
         }
+        digest = self.metrics_hash(metrics)
+        if not force and prev and prev.get("hash") == digest:
+            return ""
+        metrics["hash"] = digest
         self.storage.store_daily_metrics(repository, metrics)
         return self.generate_slack_report(metrics)
 
     def send_daily_report(self, repository: str, channel: str) -> bool:
-        """Collect metrics and post the report to Slack."""
+        """Collect metrics and post the report to Slack.
+
+        Returns ``False`` without posting when nothing changed since the last
+        stored report.
+        """
         report = self.collect_daily_metrics(repository)
+        if not report:
+            return False
         return self.slack.post_message(channel, report)
 
+    @staticmethod
+    def metrics_hash(metrics: Dict[str, Any]) -> str:
+        """Return a digest of ``metrics`` ignoring the date and stored hash."""
+        content = {k: v for k, v in metrics.items() if k not in {"date", "hash"}}
+        encoded = json.dumps(content, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
     # ------------------------------------------------------------------
     def calculate_time_to_task(self) -> float:
-        func = getattr(self.github, "calculate_time_to_task", lambda: 0.0)
-        return float(func())
+        return float(self._time_to_task())
 
     def calculate_wau(self) -> int:
         if hasattr(self.audit, "weekly_active_users"):
             return int(self.audit.weekly_active_users())
-        func = getattr(self.github, "weekly_active_users", lambda: 0)
-        return int(func())
+        return int(self._github_wau())
 
     def calculate_loc_per_assignee(self) -> int:
-        func = getattr(self.github, "calculate_loc_per_assignee", lambda: 0)
-        return int(func())
+        return int(self._loc_per_assignee())
 
     def calculate_sprint_completion(self) -> float:
-        func = getattr(self.github, "calculate_sprint_completion", lambda: 0.0)
-        return float(func())
+        return float(self._sprint_completion())
 
-    def calculate_orphan_count(self) -> int:
+    def calculate_orphan_count(self, nodes: Dict[int, Any] | None = None) -> int:
+        if nodes is None:
+            nodes = self.get_hierarchy_tree()
+        return len(self.hierarchy_manager.find_orphans(nodes))
+
+    @cached_property
+    def hierarchy_manager(self) -> HierarchyManager:
+        """Return the hierarchy manager shared by all collections."""
         from ..tasks.hierarchy_manager import HierarchyManager
 
-        hm = HierarchyManager(self.github)
-        nodes = hm.build_tree()
-        return len(hm.find_orphans(nodes))
+        return HierarchyManager(self.github)
+
+    def invalidate_hierarchy(self) -> None:
+        """Drop the cached hierarchy manager and tree."""
+        self.__dict__.pop("hierarchy_manager", None)
+        self._tree_cache = None
 
-    def calculate_approval_rate(self) -> float:
-        approvals = self.audit.count_approvals(days=7)
-        total = self.audit.count_ai_recommendations(days=7)
-        return (approvals / total * 100) if total > 0 else 0.0
+    def get_hierarchy_tree(self) -> Dict[int, Any]:
+        """Return the issue hierarchy, rebuilt at most every ``TREE_TTL`` seconds."""
+        now = time.monotonic()
+        cached = self._tree_cache
+        if cached and now - cached[0] < self.TREE_TTL:
+            return cached[1]
+        nodes = self.hierarchy_manager.build_tree()
+        self._tree_cache = (now, nodes)
+        return nodes
 
-    def calculate_override_rate(self) -> float:
-        total = self.audit.count_ai_recommendations(days=7)
-        overrides = self.audit.count_human_overrides()
-        return (overrides / total * 100) if total > 0 else 0.0
+    def calculate_approval_rate(
+        self, approvals: int | None = None, total: int | None = None
+    ) -> float:
+        if approvals is None:
+            approvals = self.audit.count_approvals(days=7)
+        if total is None:
+            total = self.audit.count_ai_recommendations(days=7)
+        return self._rate(approvals, total)
 
-    def calculate_undo_rate(self) -> float:
-        total = self.audit.count_ai_recommendations(days=7)
-        undos = 0
+    def calculate_override_rate(
+        self, overrides: int | None = None, total: int | None = None
+    ) -> float:
+        if total is None:
+            total = self.audit.count_ai_recommendations(days=7)
+        if overrides is None:
+            overrides = self.audit.count_human_overrides()
+        return self._rate(overrides, total)
+
+    def calculate_undo_rate(
+        self, undos: int | None = None, total: int | None = None
+    ) -> float:
+        if total is None:
+            total = self.audit.count_ai_recommendations(days=7)
+        if undos is None:
+            undos = self._count_undos()
+        return self._rate(undos, total)
+
+    def _count_undos(self) -> int:
         if hasattr(self.audit, "count_undo_operations"):
-            undos = self.audit.count_undo_operations(days=7)
-        return (undos / total * 100) if total > 0 else 0.0
+            return self.audit.count_undo_operations(days=7)
+        return 0
+
+    @staticmethod
+    def _rate(count: int, total: int) -> float:
+        return (count / total * 100) if total > 0 else 0.0
 
     @staticmethod
     def calculate_trend(current: float, previous: float | None) -> float:
@@ -114,20 +261,4 @@ class MetricsCollector:
     # ------------------------------------------------------------------
     def generate_slack_report(self, metrics: Dict[str, Any]) -> str:
         """Format metrics into a Slack-friendly message."""
-        return (
-            f"📊 **Daily Team Metrics** - {metrics['repository']}\n\n"
-            f"**🎯 Planning Efficiency**\n"
-            f"• Time to task assignment: {metrics['time_to_task_avg']:.1f} hours\n"
-            f"• AI approval rate: {metrics['approval_rate']:.1f}%\n"
-            f"• Sprint completion: {metrics['sprint_completion_rate']:.1f}%\n\n"
-            f"**👥 Team Activity**\n"
-            f"• Weekly active users: {metrics['weekly_active_users']} team members\n"
-            f"• Planning commands used: {metrics['planning_commands_used']} today\n"
-            f"• Human overrides: {metrics['human_overrides_count']} (learning opportunities)\n"
-            f"• Undo rate: {metrics['undo_rate']:.1f}%\n\n"
-            f"**📈 Development Velocity**\n"
-            f"• LOC per assignee: {metrics['loc_per_assignee']} avg\n"
-            f"• Open issues: {metrics['open_issues_count']}\n"
-            f"• Orphan issues: {metrics['orphan_issues_count']}\n\n"
-            "💡 Use `/autonomy status` for detailed metrics"
-        )
+        return _REPORT_TEMPLATE.format_map(metrics)
@@ -1,46 +1,118 @@
 from __future__ import annotations
 
 import json
+import os
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 from statistics import mean
 from typing import Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Metric keys holding per-person data that must never be persisted
+PERSONAL_KEYS = frozenset({"loc_per_contributor"})
+
+
+def _dumps(data: Dict) -> str:
+    if orjson is not None:
+        # Non-string keys are stringified like the stdlib ``json`` fallback
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str, separators=(",", ":"))
+
+
+def _loads(raw: str) -> Dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class MetricsStorage:
-    """Store metrics data on disk."""
+    """Store metrics data in a SQLite database on disk."""
 
     def __init__(self, storage_path: Path) -> None:
         self.storage_path = Path(storage_path) / "metrics"
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.storage_path / "metrics.db"
+        self._init_db()
+        self._migrate_json_files()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS metrics ("
+                "repo TEXT NOT NULL, date TEXT NOT NULL, payload TEXT NOT NULL, "
+                "PRIMARY KEY (repo, date))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_repo_date ON metrics(repo, date DESC)"
+            )
+
+    def _migrate_json_files(self) -> None:
+        """Import legacy ``<repo>_<date>.json`` files into the database."""
+        # Runs on every construction; scandir skips glob's pattern matching
+        with os.scandir(self.storage_path) as entries:
+            files = [
+                Path(e.path)
+                for e in entries
+                if e.name.endswith(".json") and e.is_file(follow_symlinks=False)
+            ]
+        if not files:
+            return
+        with closing(self._connect()) as conn, conn:
+            for file in files:
+                try:
+                    data = _loads(file.read_text())
+                    repo = data["repository"]
+                    date = str(data["date"])
+                except Exception:
+                    continue
+                conn.execute(
+                    "INSERT OR IGNORE INTO metrics VALUES (?, ?, ?)",
+                    (repo, date, _dumps(data)),
+                )
+                file.rename(file.with_suffix(".json.migrated"))
 
     def store_daily_metrics(self, repository: str, metrics: Dict) -> None:
         """Persist metrics, filtering personal data."""
-        safe_metrics = self.filter_personal_data(metrics)
-        safe_repo = repository.replace("/", "-")
-        filename = f"{safe_repo}_{metrics['date']}.json"
-        with open(self.storage_path / filename, "w", encoding="utf-8") as f:
-            json.dump(safe_metrics, f, default=str)
+        payload = _dumps(self.filter_personal_data(metrics))
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO metrics VALUES (?, ?, ?)",
+                (repository, str(metrics["date"]), payload),
+            )
 
     def filter_personal_data(self, metrics: Dict) -> Dict:
         """Remove personal identifiers while keeping useful aggregates."""
-        safe = metrics.copy()
-        if "loc_per_contributor" in safe:
-            safe["loc_per_assignee"] = mean(list(safe["loc_per_contributor"].values()))
-            del safe["loc_per_contributor"]
+        safe = {k: v for k, v in metrics.items() if k not in PERSONAL_KEYS}
+        if "loc_per_contributor" in metrics:
+            safe["loc_per_assignee"] = mean(metrics["loc_per_contributor"].values())
         return safe
 
     def export_prometheus(self) -> str:
         """Return metrics formatted for Prometheus."""
         lines = []
-        for file in self.storage_path.glob("*.json"):
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT payload FROM metrics ORDER BY repo, date"
+            ).fetchall()
+        for (payload,) in rows:
             try:
-                data = json.loads(file.read_text())
+                data = _loads(payload)
             except Exception:
                 continue
             repo = data.get("repository", "unknown").replace("/", "_")
             date = data.get("date", "")
             for key, value in data.items():
-                if key in {"repository", "date"}:
+                # Only numeric samples are valid; this skips the content hash
+                if key in {"repository", "date"} or not isinstance(value, (int, float)):
                     continue
                 metric = f"autonomy_{key}"
                 lines.append(f'{metric}{{repository="{repo}",date="{date}"}} {value}')
@@ -49,11 +121,15 @@ class MetricsStorage:
     # ------------------------------------------------------------------
     def get_latest_metrics(self, repository: str) -> Dict | None:
         """Return the most recent metrics for ``repository`` if available."""
-        safe_repo = repository.replace("/", "-")
-        files = sorted(self.storage_path.glob(f"{safe_repo}_*.json"), reverse=True)
-        for file in files:
-            try:
-                return json.loads(file.read_text())
-            except Exception:
-                continue
-        return None
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT payload FROM metrics WHERE repo = ? "
+                "ORDER BY date DESC LIMIT 1",
+                (repository,),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return _loads(row[0])
+        except Exception:
+            return None
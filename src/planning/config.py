@@ -17,3 +17,5 @@ class PlanningConfig:
         }
     )
     team_preferences: Dict[str, str] = field(default_factory=dict)
+    # Ask for analysis, tasks and plan in one LLM request instead of three
+    batch_llm_calls: bool = False
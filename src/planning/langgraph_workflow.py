@@ -14,6 +14,7 @@ class PlanningState(TypedDict, total=False):
     created_at: str
     repository: str
     analysis: str
+    llm_combined: Dict[str, Any]
     priority_score: float
     tasks: List[str]
     requires_security_review: bool
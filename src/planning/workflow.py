@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import re
 from datetime import datetime
 from typing import Any, Dict
 
@@ -8,10 +10,54 @@ from ..core.platform import BaseWorkflow
 from ..tasks.ranking import RankingEngine
 from .config import PlanningConfig
 
+# Substring keyword matches used by ``route``; one scan per category
+_SECURITY_RE = re.compile("auth|security|token", re.IGNORECASE)
+_DOCS_RE = re.compile("api|public", re.IGNORECASE)
+
+_COMBINED_PROMPT = (
+    "1) Analyze {title}. Context: {context}\n"
+    "2) Decompose the analysis into tasks\n"
+    "3) Plan the work for those tasks\n"
+    'Respond as JSON with keys "analysis", "tasks" (list of strings) and "plan".'
+)
+
+
+def _parse_combined(text: str) -> Dict[str, Any] | None:
+    """Return the JSON object from a batched response, or ``None``."""
+    text = (text or "").strip()
+    if text.startswith("```"):
+        # Drop the code fence and its optional language tag
+        text = text.strip("`").partition("\n")[2]
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or not data.get("analysis"):
+        return None
+    return data
+
+
+def _split_tasks(tasks: Any) -> list[str]:
+    if isinstance(tasks, str):
+        tasks = tasks.split(";")
+    return [str(t).strip() for t in tasks or [] if str(t).strip()]
+
 
 class PlanningWorkflow(BaseWorkflow):
     """Simplified planning workflow."""
 
+    # Ranking is independent of the LLM analysis, and routing only needs it
+    STEP_DEPS = {
+        "analyze_issue": (),
+        "rank_priority": (),
+        "decompose": ("analyze_issue",),
+        "route": ("analyze_issue",),
+        "assign": ("decompose",),
+        "plan": ("decompose",),
+        "get_approval": ("plan",),
+        "approve": ("get_approval", "assign", "route", "rank_priority"),
+    }
+
     def __init__(
         self,
         memory,
@@ -47,12 +93,30 @@ class PlanningWorkflow(BaseWorkflow):
         context = self.memory.search(
             f"similar:{title}", filter_metadata={"repository": repo}
         )
-        prompt = f"Analyze {title}. Context: {context}"
         models = (
             self.model_selector.get("analysis")
             if self.model_selector
             else ["openai/gpt-4o"]
         )
+        if self.config.batch_llm_calls:
+            text = self.llm.complete_with_fallback(
+                [
+                    {
+                        "role": "user",
+                        "content": _COMBINED_PROMPT.format(
+                            title=title, context=context
+                        ),
+                    }
+                ],
+                models=models,
+                operation="analysis",
+            )
+            combined = _parse_combined(text)
+            if combined:
+                state["llm_combined"] = combined
+                state["analysis"] = str(combined["analysis"])
+                return state
+        prompt = f"Analyze {title}. Context: {context}"
         analysis = self.llm.complete_with_fallback(
             [{"role": "user", "content": prompt}],
             models=models,
@@ -73,17 +137,23 @@ class PlanningWorkflow(BaseWorkflow):
     def decompose(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Break down work using LLM and store in memory."""
         analysis = state.get("analysis", "")
-        models = (
-            self.model_selector.get("decomposition")
-            if self.model_selector
-            else ["openai/gpt-4o"]
-        )
-        text = self.llm.complete_with_fallback(
-            [{"role": "user", "content": f"Decompose: {analysis}"}],
-            models=models,
-            operation="decomposition",
-        )
-        tasks = [t.strip() for t in text.split(";") if t.strip()] or ["task1"]
+        combined = state.get("llm_combined") or {}
+        if combined.get("tasks"):
+            tasks = _split_tasks(combined["tasks"])
+            text = "; ".join(tasks)
+        else:
+            models = (
+                self.model_selector.get("decomposition")
+                if self.model_selector
+                else ["openai/gpt-4o"]
+            )
+            text = self.llm.complete_with_fallback(
+                [{"role": "user", "content": f"Decompose: {analysis}"}],
+                models=models,
+                operation="decomposition",
+            )
+            tasks = _split_tasks(text)
+        tasks = tasks or ["task1"]
         state["tasks"] = tasks
         self.memory.add(
             {
@@ -95,11 +165,9 @@ class PlanningWorkflow(BaseWorkflow):
 
     def route(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Determine additional workflows needed."""
-        analysis = state.get("analysis", "").lower()
-        state["requires_security_review"] = any(
-            k in analysis for k in ["auth", "security", "token"]
-        )
-        state["requires_docs"] = any(k in analysis for k in ["api", "public"])
+        analysis = state.get("analysis", "")
+        state["requires_security_review"] = bool(_SECURITY_RE.search(analysis))
+        state["requires_docs"] = bool(_DOCS_RE.search(analysis))
         return state
 
     def assign(self, state: Dict[str, Any]) -> Dict[str, Any]:
@@ -117,18 +185,21 @@ class PlanningWorkflow(BaseWorkflow):
 
     def plan(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """Generate final plan description."""
-        tasks = ", ".join(state.get("tasks", []))
-        models = (
-            self.model_selector.get("planning")
-            if self.model_selector
-            else ["openai/gpt-4o"]
-        )
-        plan = self.llm.complete_with_fallback(
-            [{"role": "user", "content": f"Plan for: {tasks}"}],
-            models=models,
-            operation="planning",
-        )
-        state["plan"] = plan or "basic plan"
+        combined = state.get("llm_combined") or {}
+        plan = combined.get("plan")
+        if not plan:
+            tasks = ", ".join(state.get("tasks", []))
+            models = (
+                self.model_selector.get("planning")
+                if self.model_selector
+                else ["openai/gpt-4o"]
+            )
+            plan = self.llm.complete_with_fallback(
+                [{"role": "user", "content": f"Plan for: {tasks}"}],
+                models=models,
+                operation="planning",
+            )
+        state["plan"] = str(plan) if plan else "basic plan"
         return state
 
     def get_human_approval(self, state: Dict[str, Any]) -> Dict[str, Any]:
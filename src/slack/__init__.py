@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .bot import SlackBot
 from .commands import SlashCommandHandler
@@ -15,13 +17,33 @@ from .notifications import (
 )
 from .oauth import SlackOAuth, verify_slack_signature
 
+_session: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+    """Return a pooled session shared by Slack API helpers."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        retry_strategy = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=8, max_retries=retry_strategy
+        )
+        _session.mount("https://", adapter)
+    return _session
+
 
 def get_slack_auth_info(token: str) -> dict:
     """Return Slack auth information for the provided token.
 
     Raises ValueError if the token is invalid.
     """
-    response = requests.post(
+    response = _get_session().post(
         "https://slack.com/api/auth.test",
         headers={"Authorization": f"Bearer {token}"},
         timeout=10,
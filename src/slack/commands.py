@@ -1,35 +1,44 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from ..tasks.ranking import label_names
 from .mapping import SlackGitHubMapper
 from .notifications import SystemNotifier, UndoOperation
 
+_HASH_RE = re.compile(r"[0-9a-f]{8}")
+
 
 class SlashCommandHandler:
     """Handle Slack slash commands."""
 
+    # Seconds a resolved Slack -> GitHub user mapping is reused
+    USER_CACHE_TTL = 600
+
     def __init__(
         self, task_manager, mapper: Optional[SlackGitHubMapper] = None
     ) -> None:
         self.task_manager = task_manager
         self.mapper = mapper or SlackGitHubMapper()
+        self._user_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._commands: Dict[str, Callable[[Dict], Dict]] = {
+            "/autonomy next": self.handle_next_command,
+            "/autonomy update": self.handle_update_command,
+            "/autonomy status": self.handle_status_command,
+            "/autonomy undo": self.handle_undo_command,
+        }
 
     def handle_command(self, command: str, args: Dict) -> Dict:
-        if command == "/autonomy next":
-            return self.handle_next_command(args)
-        if command == "/autonomy update":
-            return self.handle_update_command(args)
-        if command == "/autonomy status":
-            return self.handle_status_command(args)
-        if command == "/autonomy undo":
-            return self.handle_undo_command(args)
-        return self.handle_help_command()
+        handler = self._commands.get(command)
+        if handler is None:
+            return self.handle_help_command()
+        return handler(args)
 
     def handle_next_command(self, args: Dict) -> Dict:
         slack_user = args.get("user_id") or args.get("user")
-        github_user = self.mapper.get_github_user(slack_user) if slack_user else None
+        github_user = self._resolve_github_user(slack_user)
         issue = self.task_manager.get_next_task(assignee=github_user)
         if not issue:
             return {"text": "No tasks found", "response_type": "ephemeral"}
@@ -66,19 +75,9 @@ class SlashCommandHandler:
 
     def handle_status_command(self, args: Dict) -> Dict:
         slack_user = args.get("user_id") or args.get("user")
-        github_user = self.mapper.get_github_user(slack_user) if slack_user else None
+        github_user = self._resolve_github_user(slack_user)
         tasks = self.task_manager.list_tasks(assignee=github_user)
-        in_progress = len(
-            [
-                task
-                for task in tasks
-                if "in-progress"
-                in [
-                    label if isinstance(label, str) else label.get("name")
-                    for label in task.get("labels", [])
-                ]
-            ]
-        )
+        in_progress = sum(1 for task in tasks if "in-progress" in label_names(task))
         blocks = [
             {
                 "type": "section",
@@ -109,7 +108,7 @@ class SlashCommandHandler:
 
     def handle_undo_command(self, args: Dict) -> Dict:
         hash_value = args.get("text", "").strip()
-        if not hash_value or not re.fullmatch(r"[0-9a-f]{8}", hash_value):
+        if not hash_value or not _HASH_RE.fullmatch(hash_value):
             return {
                 "text": "Usage: `/autonomy undo <hash>`",
                 "response_type": "ephemeral",
@@ -122,10 +121,9 @@ class SlashCommandHandler:
 
         from src.audit.undo import UndoManager
 
-        logs = list(logger.iter_logs())
         if not any(
             entry.get("hash") == hash_value or entry.get("diff_hash") == hash_value
-            for entry in logs
+            for entry in logger.iter_logs()
         ):
             return {
                 "text": f"Hash `{hash_value}` not found",
@@ -166,11 +164,19 @@ class SlashCommandHandler:
         }
 
     # --------------------- helpers ---------------------
+    def _resolve_github_user(self, slack_user: Optional[str]) -> Optional[str]:
+        if not slack_user:
+            return None
+        now = time.monotonic()
+        cached = self._user_cache.get(slack_user)
+        if cached and now - cached[0] < self.USER_CACHE_TTL:
+            return cached[1]
+        github_user = self.mapper.get_github_user(slack_user)
+        self._user_cache[slack_user] = (now, github_user)
+        return github_user
+
     def format_task_blocks(self, issue: Dict[str, Any]) -> List[Dict[str, Any]]:
-        labels = [
-            label if isinstance(label, str) else label.get("name")
-            for label in issue.get("labels", [])
-        ]
+        labels = list(label_names(issue))
         issue_mgr = getattr(self.task_manager, "issue_manager", None)
         owner = issue_mgr.owner if issue_mgr else "owner"
         repo = issue_mgr.repo if issue_mgr else "repo"
@@ -40,8 +40,10 @@ class WeeklyMetrics:
     weekly_active_users: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class UndoOperation:
+    __slots__ = ("description", "actor", "hash")
+
     description: str
     actor: str
     hash: str
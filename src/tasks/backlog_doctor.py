@@ -1,10 +1,126 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import chain, combinations, repeat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from ..github.issue_manager import IssueManager
+from .ranking import parse_timestamp
+
+try:
+    import numpy as np
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - rapidfuzz optional
+    np = None
+    process = None
+
+_CHECKLIST_RE = re.compile(r"^[ \t]*- \[", re.M)
+
+
+# Backlogs at least this large are compared across a process pool. Each
+# spawned worker re-imports the package (~1.6-2.5 s), about what 200 issues
+# take serially, so the pool only pays off well past that break-even.
+PARALLEL_MIN_ISSUES = 500
+
+# Each pool worker is given at least this many rows to compare
+PARALLEL_ROWS_PER_WORKER = 100
+
+# Body tokens shared by more issues than this are too common to block on
+BLOCK_MAX_ISSUES = 10
+
+
+def _difflib_rows(
+    texts: List[Tuple[str, str]], threshold: float, rows: Iterable[int]
+) -> List[Tuple[int, int, float]]:
+    found: List[Tuple[int, int, float]] = []
+    for i in rows:
+        for j in range(i + 1, len(texts)):
+            sim = 0.0
+            for a, b in zip(texts[i], texts[j]):
+                # real_quick_ratio() and quick_ratio() are cheap upper bounds
+                # of ratio(); skip pairs that cannot reach the threshold or
+                # improve on the title score.
+                floor = max(threshold, sim)
+                matcher = SequenceMatcher(None, a, b)
+                if (
+                    matcher.real_quick_ratio() >= floor
+                    and matcher.quick_ratio() >= floor
+                ):
+                    sim = max(sim, matcher.ratio())
+            if sim >= threshold:
+                found.append((i, j, sim))
+    return found
+
+
+def _difflib_pairs(
+    texts: List[Tuple[str, str]], threshold: float
+) -> Iterable[Tuple[int, int, float]]:
+    workers = min(os.cpu_count() or 1, len(texts) // PARALLEL_ROWS_PER_WORKER)
+    if len(texts) < PARALLEL_MIN_ISSUES or workers < 2:
+        return _difflib_rows(texts, threshold, range(len(texts)))
+    # Interleave rows so every worker gets a similar share of pairs
+    chunks = [range(k, len(texts), workers) for k in range(workers)]
+    # Spawned workers: the API server calls this from a multi-threaded
+    # process, where forking can deadlock
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        results = pool.map(_difflib_rows, repeat(texts), repeat(threshold), chunks)
+        return sorted(chain.from_iterable(results))
+
+
+def _body_candidates(bodies: List[str]) -> Set[Tuple[int, int]]:
+    """Return index pairs whose bodies share a rare token or are identical."""
+    by_body: Dict[str, List[int]] = defaultdict(list)
+    by_token: Dict[str, List[int]] = defaultdict(list)
+    for n, body in enumerate(bodies):
+        by_body[body].append(n)
+        for token in set(body.split()):
+            by_token[token].append(n)
+    rare = (g for g in by_token.values() if len(g) <= BLOCK_MAX_ISSUES)
+    candidates: Set[Tuple[int, int]] = set()
+    for group in chain(by_body.values(), rare):
+        candidates.update(combinations(group, 2))
+    return candidates
+
+
+def _rapidfuzz_pairs(
+    texts: List[Tuple[str, str]], threshold: float
+) -> Iterator[Tuple[int, int, float]]:
+    """Yield similar pairs using rapidfuzz.
+
+    Titles are compared all-against-all; bodies only for pairs whose titles
+    already match or whose bodies share a rare token. ``fuzz.ratio`` is an
+    Indel distance and scores differently from ``SequenceMatcher.ratio``, so
+    results depend on whether rapidfuzz is installed.
+    """
+    if not texts:
+        return
+    cutoff = threshold * 100
+    titles = [title for title, _ in texts]
+    bodies = [body for _, body in texts]
+    scores = process.cdist(
+        titles, titles, scorer=fuzz.ratio, score_cutoff=cutoff, workers=-1
+    )
+    rows, cols = np.nonzero(np.triu(scores >= cutoff, 1))
+    title_hits = {
+        (i, j): float(scores[i, j]) for i, j in zip(rows.tolist(), cols.tolist())
+    }
+    del scores
+    candidates = _body_candidates(bodies)
+    candidates.update(title_hits)
+    for i, j in sorted(candidates):
+        sim = max(
+            title_hits.get((i, j), 0.0),
+            fuzz.ratio(bodies[i], bodies[j], score_cutoff=cutoff),
+        )
+        if sim >= cutoff:
+            yield i, j, sim / 100
 
 
 class BacklogDoctor:
@@ -28,7 +144,8 @@ class BacklogDoctor:
         self, days: int = 14, issues: Optional[List[Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
         """Return issues with no updates for the given number of days."""
-        issues = issues or self._open_issues()
+        if issues is None:
+            issues = self._open_issues()
         now = datetime.now(timezone.utc)
         stale: List[Dict[str, Any]] = []
         for issue in issues:
@@ -36,7 +153,7 @@ class BacklogDoctor:
             if not ts:
                 continue
             try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+                dt = parse_timestamp(ts)
             except Exception:
                 continue
             if (now - dt).days > days:
@@ -47,13 +164,12 @@ class BacklogDoctor:
         self, limit: int = 10, issues: Optional[List[Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
         """Return issues with more than ``limit`` checklist items."""
-        issues = issues or self._open_issues()
+        if issues is None:
+            issues = self._open_issues()
         oversized: List[Dict[str, Any]] = []
         for issue in issues:
             body = issue.get("body", "")
-            count = sum(
-                1 for line in body.splitlines() if line.strip().startswith("- [")
-            )
+            count = sum(1 for _ in _CHECKLIST_RE.finditer(body))
             if count > limit:
                 oversized.append(issue)
         return oversized
@@ -64,21 +180,13 @@ class BacklogDoctor:
         issues: Optional[List[Dict[str, Any]]] = None,
     ) -> List[Tuple[Dict[str, Any], Dict[str, Any], float]]:
         """Return pairs of issues that look like duplicates."""
-        issues = issues or self._open_issues()
-        dupes: List[Tuple[Dict[str, Any], Dict[str, Any], float]] = []
-        for i in range(len(issues)):
-            for j in range(i + 1, len(issues)):
-                a, b = issues[i], issues[j]
-                title_sim = SequenceMatcher(
-                    None, a.get("title", "").lower(), b.get("title", "").lower()
-                ).ratio()
-                body_sim = SequenceMatcher(
-                    None, a.get("body", "").lower(), b.get("body", "").lower()
-                ).ratio()
-                sim = max(title_sim, body_sim)
-                if sim >= threshold:
-                    dupes.append((a, b, sim))
-        return dupes
+        if issues is None:
+            issues = self._open_issues()
+        texts = [
+            (i.get("title", "").lower(), i.get("body", "").lower()) for i in issues
+        ]
+        pairs = _difflib_pairs if process is None else _rapidfuzz_pairs
+        return [(issues[i], issues[j], sim) for i, j, sim in pairs(texts, threshold)]
 
     # -------------------------------------------------------------
     def run(
@@ -91,35 +199,35 @@ class BacklogDoctor:
     ) -> Dict[str, Any]:
         """Run selected checks and apply labels."""
         results = {"stale": [], "duplicates": [], "oversized": []}
+        if not (check_stale or check_oversized or check_duplicates):
+            return results
+        issues = self._open_issues()
+        # Collect labels per issue so each issue is updated with one API call
+        to_label: Dict[int, Dict[str, None]] = defaultdict(dict)
 
         if check_stale:
-            stale = self.find_stale_issues(days=stale_days)
+            stale = self.find_stale_issues(days=stale_days, issues=issues)
             results["stale"] = [i["number"] for i in stale]
             for issue in stale:
-                self.issue_manager.update_issue_labels(
-                    issue["number"], add_labels=[self.STALE_LABEL]
-                )
+                to_label[issue["number"]][self.STALE_LABEL] = None
 
         if check_oversized:
-            oversized = self.find_oversized_issues(limit=checklist_limit)
+            oversized = self.find_oversized_issues(limit=checklist_limit, issues=issues)
             results["oversized"] = [i["number"] for i in oversized]
             for issue in oversized:
-                self.issue_manager.update_issue_labels(
-                    issue["number"], add_labels=[self.OVERSIZED_LABEL]
-                )
+                to_label[issue["number"]][self.OVERSIZED_LABEL] = None
 
         if check_duplicates:
-            duplicates = self.find_duplicate_candidates()
+            duplicates = self.find_duplicate_candidates(issues=issues)
             results["duplicates"] = [
                 (a["number"], b["number"]) for a, b, _ in duplicates
             ]
             for a, b, _ in duplicates:
-                self.issue_manager.update_issue_labels(
-                    a["number"], add_labels=[self.DUPLICATE_LABEL]
-                )
-                self.issue_manager.update_issue_labels(
-                    b["number"], add_labels=[self.DUPLICATE_LABEL]
-                )
+                to_label[a["number"]][self.DUPLICATE_LABEL] = None
+                to_label[b["number"]][self.DUPLICATE_LABEL] = None
+
+        for number, labels in to_label.items():
+            self.issue_manager.update_issue_labels(number, add_labels=list(labels))
 
         return results
 
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 from ..github.issue_manager import Issue, IssueManager
+from .ranking import label_names
 
 
 @dataclass
@@ -46,14 +47,10 @@ class HierarchyManager:
         issues = self.issue_manager.list_issues(state="open")
         nodes: Dict[int, IssueNode] = {}
         for issue in issues:
-            labels = [
-                lbl["name"] if isinstance(lbl, dict) and "name" in lbl else lbl
-                for lbl in issue.get("labels", [])
-            ]
             node = IssueNode(
                 number=issue["number"],
                 title=issue.get("title", ""),
-                labels=labels,
+                labels=list(label_names(issue)),
                 body=issue.get("body", ""),
             )
             node.parent = self._parse_parent(node.body)
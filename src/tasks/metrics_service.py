@@ -27,7 +27,8 @@ class DailyMetricsService:
         for repo, channel in repo_channels.items():
             owner, name = repo.split("/")
             manager = IssueManager(github_token, owner, name)
-            audit = AuditLogger(Path(log_path))
+            # Reports tolerate slightly stale counters, so reuse repeated scans
+            audit = AuditLogger(Path(log_path), count_cache_ttl=60.0)
             storage = MetricsStorage(Path(storage_path))
             collector = MetricsCollector(
                 manager, self.scheduler.slack_client, audit, storage
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 
 
 class PinnedItemsStore:
@@ -44,6 +44,10 @@ class PinnedItemsStore:
         data = self.load_pinned_items()
         return item_id in data.get(project_id, [])
 
+    def pinned_numbers(self, project_id: str) -> FrozenSet[str]:
+        """Return all pinned item ids for ``project_id`` with a single read."""
+        return frozenset(self.load_pinned_items().get(project_id, []))
+
     def list_pinned(self, project_id: str) -> List[str]:
         data = self.load_pinned_items()
         return data.get(project_id, [])
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 try:
     import yaml
@@ -11,6 +11,34 @@ except Exception:  # pragma: no cover - yaml optional
     yaml = None
 
 
+def parse_timestamp(ts: str) -> datetime:
+    """Parse a GitHub ISO-8601 timestamp into an aware ``datetime``.
+
+    GitHub's ``YYYY-MM-DDTHH:MM:SSZ`` form is parsed by slicing; anything
+    else goes through :meth:`datetime.fromisoformat`.
+    """
+    if len(ts) == 20 and ts[19] == "Z":
+        return datetime(
+            int(ts[:4]),
+            int(ts[5:7]),
+            int(ts[8:10]),
+            int(ts[11:13]),
+            int(ts[14:16]),
+            int(ts[17:19]),
+            tzinfo=timezone.utc,
+        )
+    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+
+def label_names(issue: Dict[str, Any]) -> Tuple[str, ...]:
+    """Return label names for ``issue`` whether labels are strings or dicts."""
+    # ``type() is dict`` matches decoded GitHub payloads without an MRO walk
+    return tuple(
+        lab.get("name", lab) if type(lab) is dict else lab
+        for lab in issue.get("labels") or ()
+    )
+
+
 @dataclass
 class RankingConfig:
     """Configuration for task ranking."""
@@ -50,6 +78,9 @@ class RankingConfig:
 class RankingEngine:
     """Multi-signal ranking engine for issues."""
 
+    # Issues whose parsed ranking features are kept between calls
+    FEATURE_CACHE_SIZE = 4096
+
     def __init__(
         self,
         config: Optional[RankingConfig] = None,
@@ -58,49 +89,88 @@ class RankingEngine:
     ) -> None:
         self.config = config or RankingConfig()
         self.config.load_from_file(config_path or Path(".autonomy.yml"))
+        self._features: Dict[Tuple[Any, Any], Tuple[bool, int, Any, Any]] = {}
 
-    # ------------------------------------------------------------------
-    def score_issue(
-        self, issue: Dict[str, Any], *, pinned: bool = False, explain: bool = False
-    ) -> float | tuple[float, Dict[str, Any]]:
-        labels = [
-            lab["name"] if isinstance(lab, dict) and "name" in lab else lab
-            for lab in issue.get("labels", [])
-        ]
-        if (
+    def clear_cache(self) -> None:
+        """Forget cached issue features, e.g. after changing ``config``."""
+        self._features.clear()
+
+    def _issue_features(
+        self, issue: Dict[str, Any], labels: Sequence[str]
+    ) -> Tuple[bool, int, Optional[datetime], Optional[datetime]]:
+        """Return ``(excluded, priority, due, created)`` for ``issue``."""
+        excluded = (
             any(lbl in self.config.excluded_labels for lbl in labels)
             or issue.get("state") == "closed"
-        ):
-            return (float("-inf"), {}) if explain else float("-inf")
+        )
+        mapping = self.config.priority_mapping
+        priority = max((mapping.get(lbl, 0) for lbl in labels), default=0)
 
-        w = self.config.weights
-        priority = 0
-        for lbl in labels:
-            priority = max(priority, self.config.priority_mapping.get(lbl, 0))
-
-        sprint_score = 0
-        milestone = issue.get("milestone")
-        if isinstance(milestone, dict) and milestone.get("due_on"):
+        def parse(ts: Any) -> Optional[datetime]:
             try:
-                due = datetime.fromisoformat(milestone["due_on"].replace("Z", "+00:00"))
-                days = (due - datetime.now(timezone.utc)).days
-                sprint_score = max(0, 30 - days)
+                dt = parse_timestamp(ts)
             except Exception:
-                pass
+                return None
+            # Naive timestamps cannot be compared with ``now`` and score as 0
+            return dt if dt.tzinfo else None
 
-        age_days = 0
+        due = None
+        milestone = issue.get("milestone")
+        if isinstance(milestone, dict) and milestone.get("due_on"):
+            due = parse(milestone["due_on"])
         created = issue.get("created_at")
-        if created:
-            try:
-                dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                age_days = (datetime.now(timezone.utc) - dt).days
-            except Exception:
-                pass
+        return excluded, priority, due, parse(created) if created else None
+
+    # ------------------------------------------------------------------
+    def score_issue(
+        self,
+        issue: Dict[str, Any],
+        *,
+        pinned: bool = False,
+        explain: bool = False,
+        labels: Optional[Sequence[str]] = None,
+        now: Optional[datetime] = None,
+        min_score: Optional[float] = None,
+    ) -> float | tuple[float, Dict[str, Any]]:
+        """Return the ranking score for ``issue``.
+
+        When ``min_score`` is given and the issue cannot reach it even before
+        the age penalty is applied, ``-inf`` is returned early. Parsed labels
+        and timestamps are cached per ``(number, updated_at)``, so an issue is
+        only re-parsed after GitHub reports a change.
+        """
+        key = (issue.get("number"), issue.get("updated_at"))
+        cacheable = None not in key
+        features = self._features.get(key) if cacheable else None
+        if features is None:
+            if labels is None:
+                labels = label_names(issue)
+            features = self._issue_features(issue, labels)
+            if cacheable:
+                if len(self._features) >= self.FEATURE_CACHE_SIZE:
+                    self._features.clear()
+                self._features[key] = features
+        excluded, priority, due, created = features
+        if excluded:
+            return (float("-inf"), {}) if explain else float("-inf")
+
+        if now is None:
+            now = datetime.now(timezone.utc)
+        w = self.config.weights
+        sprint_score = max(0, 30 - (due - now).days) if due else 0
 
         score = 0.0
         score += priority * w.get("priority_field", 100)
         score += sprint_score * w.get("sprint_proximity", 3)
-        score -= age_days * w.get("issue_age", 1)
+        age_weight = w.get("issue_age", 1)
+        if min_score is not None and age_weight >= 0:
+            bound = score + (w.get("pinned_boost", 1000) if pinned else 0)
+            if bound < min_score:
+                return (float("-inf"), {}) if explain else float("-inf")
+
+        # Clamped so clock skew cannot beat the ``min_score`` bound above
+        age_days = max(0, (now - created).days) if created else 0
+        score -= age_days * age_weight
         if pinned:
             score += w.get("pinned_boost", 1000)
 
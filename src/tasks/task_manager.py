@@ -1,20 +1,44 @@
 from __future__ import annotations
 
+import heapq
+import logging
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import AbstractSet, Any, Dict, Iterator, Optional, Sequence, Tuple
 
 from ..audit.logger import AuditLogger
 from ..core.config import WorkflowConfig
 from ..github.issue_manager import IssueManager
 from .hierarchy_manager import HierarchyManager
 from .pinned_items import PinnedItemsStore
-from .ranking import RankingConfig, RankingEngine
+from .ranking import RankingConfig, RankingEngine, label_names
+
+logger = logging.getLogger(__name__)
+
+
+_EMPTY: Tuple[Any, ...] = ()
+
+
+def _assignee_logins(issue: Dict[str, Any]) -> Iterator[str]:
+    """Yield the logins of every assignee on ``issue``."""
+    assignee = issue.get("assignee")
+    if assignee:
+        yield assignee.get("login")
+    for a in issue.get("assignees") or _EMPTY:
+        if a:
+            yield a.get("login")
 
 
 class TaskManager:
     """Utility for retrieving and updating GitHub issues as tasks."""
 
+    # Seconds the open issue list is reused between ranking calls
+    issues_ttl: float = 30
+    ranking_max_workers: int = 1
+
     def __init__(
         self,
         github_token: str,
@@ -44,16 +68,97 @@ class TaskManager:
             ranking_config, config_path=Path(config_path) if config_path else None
         )
         self.sync_cooldown = getattr(self.config, "hierarchy_sync_cooldown", 60)
-        self._last_sync = 0.0
+        self.issues_ttl = getattr(self.config, "issues_cache_ttl", self.issues_ttl)
+        self.ranking_max_workers = getattr(self.config, "ranking_max_workers", 1)
+        self._init_state()
+
+    def _init_state(self) -> None:
+        """Create the per-instance issue cache and sync debounce state."""
+        self._issues_cache: Optional[tuple[float, list[Dict[str, Any]]]] = None
+        self._issues_etag: Optional[str] = None
+        self._sync_timer: Optional[threading.Timer] = None
+        self._sync_lock = threading.Lock()
+        self._sync_reasons: frozenset[str] = frozenset()
+        self._hierarchy: Optional[HierarchyManager] = None
+        self._last_sync = float("-inf")
 
     # -------------------------- retrieval helpers ---------------------------
+    def _open_issues(self) -> list[Dict[str, Any]]:
+        now = time.monotonic()
+        cached = self._issues_cache
+        if cached and now - cached[0] < self.issues_ttl:
+            return cached[1]
+        fetch = getattr(self.issue_manager, "list_issues_conditional", None)
+        if fetch is None:
+            issues = self.issue_manager.list_issues(state="open")
+            # list_issues() also returns [] on errors, so never cache it
+            if not issues:
+                return issues
+        else:
+            etag = self._issues_etag if cached else None
+            status, etag, issues = fetch(state="open", etag=etag)
+            if status == 304 and cached:
+                issues = cached[1]
+            elif status != 200:
+                # Serve the last good list rather than caching a failed fetch
+                return cached[1] if cached else issues
+            self._issues_etag = etag
+        self._issues_cache = (now, issues)
+        return issues
+
+    def invalidate_issues(self) -> None:
+        """Drop the cached open issue list."""
+        self._issues_cache = None
+        self._issues_etag = None
+
+    def _is_pinned(
+        self, issue: Dict[str, Any], pinned: Optional[AbstractSet[str]]
+    ) -> bool:
+        if pinned is None:
+            pinned = self.pinned_store.pinned_numbers(self.project_id)
+        return str(issue.get("number")) in pinned
+
     def _score_issue(
-        self, issue: Dict[str, Any], explain: bool = False
-    ) -> float | tuple[float, dict]:
-        pinned = self.pinned_store.is_pinned(self.project_id, str(issue.get("number")))
-        if pinned:
-            return (float("-inf"), {}) if explain else float("-inf")
-        return self.ranking.score_issue(issue, pinned=False, explain=explain)
+        self,
+        issue: Dict[str, Any],
+        labels: Optional[Sequence[str]] = None,
+        now: Optional[datetime] = None,
+        min_score: Optional[float] = None,
+        pinned: Optional[AbstractSet[str]] = None,
+    ) -> float:
+        if self._is_pinned(issue, pinned):
+            return float("-inf")
+        return self.ranking.score_issue(
+            issue, labels=labels, now=now, min_score=min_score
+        )
+
+    def _score_issue_explain(
+        self,
+        issue: Dict[str, Any],
+        labels: Optional[Sequence[str]] = None,
+        now: Optional[datetime] = None,
+        min_score: Optional[float] = None,
+        pinned: Optional[AbstractSet[str]] = None,
+    ) -> tuple[float, dict]:
+        if self._is_pinned(issue, pinned):
+            return float("-inf"), {}
+        return self.ranking.score_issue(
+            issue, explain=True, labels=labels, now=now, min_score=min_score
+        )
+
+    def _iter_filtered(
+        self, assignee: Optional[str], team: Optional[str]
+    ) -> Iterator[tuple[int, Dict[str, Any], Tuple[str, ...]]]:
+        """Yield ``(index, issue, labels)`` for open issues matching filters."""
+        team_label = f"team:{team.lower()}" if team else None
+        for index, issue in enumerate(self._open_issues()):
+            # Cheapest check first: skip label extraction for other assignees
+            if assignee and assignee not in _assignee_logins(issue):
+                continue
+            labels = label_names(issue)
+            if team_label and not any(lbl.lower() == team_label for lbl in labels):
+                continue
+            yield index, issue, labels
 
     def get_next_task(
         self,
@@ -62,39 +167,46 @@ class TaskManager:
         explain: bool = False,
     ) -> Optional[Dict[str, Any]] | tuple[Optional[Dict[str, Any]], dict]:
         """Return the highest scoring unblocked issue."""
-        issues = self.issue_manager.list_issues(state="open")
-        candidates = []
-        for issue in issues:
-            labels = [
-                label["name"] if isinstance(label, dict) and "name" in label else label
-                for label in issue.get("labels", [])
-            ]
-            if assignee:
-                found = False
-                if issue.get("assignee") and issue["assignee"].get("login") == assignee:
-                    found = True
-                for a in issue.get("assignees", []) or []:
-                    if a and a.get("login") == assignee:
-                        found = True
-                if not found:
-                    continue
-            if team and not any(
-                lbl.lower() == f"team:{team.lower()}" for lbl in labels
-            ):
-                continue
-            score_data = self._score_issue(issue, explain=explain)
-            if explain:
-                score, breakdown = score_data
-            else:
-                score = score_data
-            if score != float("-inf"):
-                candidates.append((score, issue, breakdown if explain else None))
+        now = datetime.now(timezone.utc)
+        # One pinned-store read per query rather than one per issue
+        pinned = self.pinned_store.pinned_numbers(self.project_id)
+        if explain:
+            return self._get_next_task_explained(assignee, team, now, pinned)
+        best: Optional[tuple[float, Dict[str, Any]]] = None
+        for _, issue, labels in self._iter_filtered(assignee, team):
+            score = self._score_issue(
+                issue,
+                labels=labels,
+                now=now,
+                min_score=best[0] if best else None,
+                pinned=pinned,
+            )
+            # Strict comparison keeps the first of equally scored issues
+            if score != float("-inf") and (best is None or score > best[0]):
+                best = (score, issue)
+        return best[1] if best else None
 
-        if not candidates:
-            return (None, {}) if explain else None
-        candidates.sort(key=lambda x: x[0], reverse=True)
-        best_score, best_issue, breakdown = candidates[0]
-        return (best_issue, breakdown) if explain else best_issue
+    def _get_next_task_explained(
+        self,
+        assignee: Optional[str],
+        team: Optional[str],
+        now: datetime,
+        pinned: AbstractSet[str],
+    ) -> tuple[Optional[Dict[str, Any]], dict]:
+        best: Optional[tuple[float, Dict[str, Any], dict]] = None
+        for _, issue, labels in self._iter_filtered(assignee, team):
+            score, breakdown = self._score_issue_explain(
+                issue,
+                labels=labels,
+                now=now,
+                min_score=best[0] if best else None,
+                pinned=pinned,
+            )
+            if score != float("-inf") and (best is None or score > best[0]):
+                best = (score, issue, breakdown)
+        if best is None:
+            return None, {}
+        return best[1], best[2]
 
     def list_tasks(
         self,
@@ -103,32 +215,69 @@ class TaskManager:
         limit: int = 10,
     ) -> list[Dict[str, Any]]:
         """Return a list of open tasks sorted by priority."""
-        issues = self.issue_manager.list_issues(state="open")
-        scored = []
-        for issue in issues:
-            labels = [
-                label["name"] if isinstance(label, dict) and "name" in label else label
-                for label in issue.get("labels", [])
-            ]
-            if assignee:
-                found = False
-                if issue.get("assignee") and issue["assignee"].get("login") == assignee:
-                    found = True
-                for a in issue.get("assignees", []) or []:
-                    if a and a.get("login") == assignee:
-                        found = True
-                if not found:
-                    continue
-            if team and not any(
-                lbl.lower() == f"team:{team.lower()}" for lbl in labels
-            ):
+        if limit <= 0:
+            return []
+        now = datetime.now(timezone.utc)
+        pinned = self.pinned_store.pinned_numbers(self.project_id)
+        # Min-heap of the best ``limit`` entries; ``-index`` breaks score ties
+        # in favour of earlier issues, matching a stable descending sort.
+        top: list[tuple[float, int, Dict[str, Any]]] = []
+        candidates = self._iter_filtered(assignee, team)
+        if self.ranking_max_workers > 1:
+            scores = self._score_concurrently(list(candidates), now, pinned)
+        else:
+            # Lazily scored so each issue sees the current k-th best score
+            scores = (
+                (
+                    index,
+                    issue,
+                    self._score_issue(
+                        issue,
+                        labels=labels,
+                        now=now,
+                        min_score=top[0][0] if len(top) >= limit else None,
+                        pinned=pinned,
+                    ),
+                )
+                for index, issue, labels in candidates
+            )
+        for index, issue, score in scores:
+            if score == float("-inf"):
                 continue
-            score = self._score_issue(issue)
-            if score != float("-inf"):
-                scored.append((score, issue))
+            entry = (score, -index, issue)
+            if len(top) < limit:
+                heapq.heappush(top, entry)
+            elif entry[:2] > top[0][:2]:
+                heapq.heapreplace(top, entry)
+        return [issue for _, _, issue in sorted(top, key=lambda x: x[:2], reverse=True)]
+
+    def _score_concurrently(
+        self,
+        candidates: list[tuple[int, Dict[str, Any], Tuple[str, ...]]],
+        now: datetime,
+        pinned: AbstractSet[str],
+    ) -> list[tuple[int, Dict[str, Any], float]]:
+        """Score ``candidates`` on a thread pool; failures score ``-inf``."""
+
+        def score(
+            item: tuple[int, Dict[str, Any], Tuple[str, ...]]
+        ) -> tuple[int, Dict[str, Any], float]:
+            index, issue, labels = item
+            try:
+                return (
+                    index,
+                    issue,
+                    self._score_issue(issue, labels=labels, now=now, pinned=pinned),
+                )
+            except Exception:
+                logger.exception("Scoring issue #%s failed", issue.get("number"))
+                return index, issue, float("-inf")
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [issue for _, issue in scored[:limit]]
+        if not candidates:
+            return []
+        workers = min(self.ranking_max_workers, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(score, candidates))
 
     # --------------------------- update helpers ----------------------------
     def update_task(
@@ -158,27 +307,61 @@ class TaskManager:
         # TODO: implement rollover of incomplete subtasks to new issues
         return True
 
-    def _trigger_sync(self) -> None:
-        """Run hierarchy sync asynchronously."""
+    def _trigger_sync(self, reason: Optional[str] = None) -> None:
+        """Run hierarchy sync asynchronously.
 
-        import time
+        Calls arriving within ``sync_cooldown`` of the last sync are coalesced
+        into a single follow-up sync once the cooldown has passed; their
+        ``reason`` values are recorded together in the audit log.
+        """
 
-        if time.time() - self._last_sync < self.sync_cooldown:
-            return
+        self.invalidate_issues()
+        with self._sync_lock:
+            if reason:
+                self._sync_reasons = self._sync_reasons | {reason}
+            remaining = self.sync_cooldown - (time.monotonic() - self._last_sync)
+            if remaining > 0:
+                if self._sync_timer is None:
+                    timer = threading.Timer(remaining, self._run_pending_sync)
+                    timer.daemon = True
+                    self._sync_timer = timer
+                    timer.start()
+                return
+            self._last_sync = time.monotonic()
+        threading.Thread(target=self._sync_hierarchy, daemon=True).start()
 
-        self._last_sync = time.time()
+    def _run_pending_sync(self) -> None:
+        with self._sync_lock:
+            self._sync_timer = None
+            self._last_sync = time.monotonic()
+        self._sync_hierarchy()
 
-        def run() -> None:
-            cfg = getattr(self, "config", WorkflowConfig())
+    def _hierarchy_manager(self) -> HierarchyManager:
+        """Return a HierarchyManager reused across syncs."""
+        cfg = getattr(self, "config", WorkflowConfig())
+        hm = self._hierarchy
+        if (
+            hm is None
+            or hm.issue_manager is not self.issue_manager
+            or hm.orphan_threshold != cfg.hierarchy_orphan_threshold
+        ):
             hm = HierarchyManager(
                 self.issue_manager,
                 orphan_threshold=cfg.hierarchy_orphan_threshold,
             )
-            hm.maintain_hierarchy()
-            if self.audit_logger:
-                self.audit_logger.log(
-                    "hierarchy_sync_auto",
-                    {"project": self.project_id, "created": "auto"},
-                )
+            self._hierarchy = hm
+        return hm
 
-        threading.Thread(target=run, daemon=True).start()
+    def _sync_hierarchy(self) -> None:
+        with self._sync_lock:
+            reasons, self._sync_reasons = self._sync_reasons, frozenset()
+        self._hierarchy_manager().maintain_hierarchy()
+        if self.audit_logger:
+            self.audit_logger.log(
+                "hierarchy_sync_auto",
+                {
+                    "project": self.project_id,
+                    "created": "auto",
+                    "reasons": sorted(reasons),
+                },
+            )
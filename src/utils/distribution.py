@@ -1,21 +1,53 @@
 import importlib
+import importlib.util
+from typing import Set, Tuple
 
 import httpx
 from packaging import version
 
 from .. import __version__
 
+_REQUIRED_MODULES = ("src.cli.main", "src.core.config")
 
-def verify_installation() -> bool:
-    """Verify package installation and basic imports."""
+
+# Successful probes only; a failure may come from a partial install or
+# upgrade, so it is checked again on the next call
+_verified: Set[Tuple[Tuple[str, ...], bool]] = set()
+
+
+def _probe(modules: Tuple[str, ...], deep: bool) -> bool:
     try:
-        importlib.import_module("src.cli.main")
-        importlib.import_module("src.core.config")
-        return True
+        if deep:
+            for name in modules:
+                importlib.import_module(name)
+            return True
+        return all(importlib.util.find_spec(name) for name in modules)
     except Exception:
         return False
 
 
+def verify_installation(deep: bool = False) -> bool:
+    """Verify package installation and basic imports.
+
+    By default only checks that the required modules can be located, which
+    avoids executing them. Pass ``deep=True`` to actually import them.
+    Successful results are cached per process and failures are not; call
+    ``clear_verification_cache()`` to force a fresh probe.
+    """
+    key = (_REQUIRED_MODULES, deep)
+    if key in _verified:
+        return True
+    ok = _probe(*key)
+    if ok:
+        _verified.add(key)
+    return ok
+
+
+def clear_verification_cache() -> None:
+    """Forget successful installation checks."""
+    _verified.clear()
+
+
 def check_for_updates() -> None:
     """Check PyPI for newer versions and print upgrade hint."""
     try:
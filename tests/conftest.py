@@ -1,4 +1,24 @@
+import io
 import os
 
+import pytest
+
 os.environ.setdefault("POSTHOG_DISABLED", "1")
 os.environ.setdefault("MEM0_TELEMETRY", "False")
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Return a SecretVault stored under ``tmp_path``."""
+    # Imported lazily so the telemetry variables above are set first
+    from src.core.secret_vault import SecretVault
+
+    return SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
+
+
+@pytest.fixture
+def audit_logger():
+    """Return an AuditLogger that keeps its entries in memory."""
+    from src.audit.logger import AuditLogger
+
+    return AuditLogger(io.StringIO())
@@ -19,9 +19,10 @@ def test_webhook_triggers_sync(tmp_path: Path, monkeypatch) -> None:
     log = tmp_path / "log"
     called = {}
 
-    def fake_sync(self):
+    def fake_sync(self, reason=None):
         called.setdefault("count", 0)
         called["count"] += 1
+        called["reason"] = reason
 
     monkeypatch.setattr(
         "src.tasks.task_manager.TaskManager._trigger_sync",
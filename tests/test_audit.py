@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 from src.audit.logger import AuditLogger
@@ -157,3 +158,88 @@ def test_audit_metrics_counts(tmp_path: Path) -> None:
     assert logger.count_approvals() == 1
     assert logger.weekly_active_users() == 2
     assert logger.count_undo_operations() == 1
+
+
+def test_audit_counts_uncached_by_default(tmp_path: Path) -> None:
+    logger = AuditLogger(tmp_path / "audit.log")
+    assert logger.count_command_usage("plan") == 0
+    with logger.log_path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"operation": "tool_execute", "details": {"tool": "plan"}}))
+        f.write("\n")
+    assert logger.count_command_usage("plan") == 1
+
+
+def test_audit_counts_cached_until_logged(tmp_path: Path) -> None:
+    logger = AuditLogger(tmp_path / "audit.log", count_cache_ttl=60.0)
+    logger.log("tool_execute", {"tool": "plan", "agent": "a1"})
+    assert logger.count_command_usage("plan") == 1
+    with logger.log_path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"operation": "tool_execute", "details": {"tool": "plan"}}))
+        f.write("\n")
+    assert logger.count_command_usage("plan") == 1
+    logger.log("tool_execute", {"tool": "plan", "agent": "a2"})
+    assert logger.count_command_usage("plan") == 3
+    logger.count_cache_ttl = 0
+    with logger.log_path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"operation": "tool_execute", "details": {"tool": "plan"}}))
+        f.write("\n")
+    assert logger.count_command_usage("plan") == 4
+
+
+def test_iter_logs_skips_malformed_lines(tmp_path: Path) -> None:
+    logger = AuditLogger(tmp_path / "audit.log")
+    logger.log("update_state", {"issue": 1})
+    with logger.log_path.open("a", encoding="utf-8") as f:
+        f.write("{not json\n\n")
+    logger.log("update_state", {"issue": 2})
+    assert [e["details"]["issue"] for e in logger.iter_logs()] == [1, 2]
+
+
+def test_clear_truncates_log_and_counts(tmp_path: Path) -> None:
+    logger = AuditLogger(tmp_path / "audit.log")
+    logger.log("tool_execute", {"tool": "plan", "agent": "a1"})
+    assert logger.count_command_usage("plan") == 1
+    logger.clear()
+    assert list(logger.iter_logs()) == []
+    assert logger.count_command_usage("plan") == 0
+
+
+def test_in_memory_audit_log(audit_logger) -> None:
+    h = audit_logger.log("update_state", {"issue": 1})
+    assert [e["hash"] for e in audit_logger.iter_logs()] == [h]
+    assert audit_logger.log_path is None
+    assert audit_logger.count_human_overrides() == 0
+    audit_logger.clear()
+    assert list(audit_logger.iter_logs()) == []
+
+
+def test_count_human_overrides_skips_blank_lines(tmp_path: Path) -> None:
+    overrides = tmp_path / "overrides.log"
+    overrides.write_text('{"payload": "caf\u00e9"}\n\n  \n{"payload": 2}', "utf-8")
+    logger = AuditLogger(tmp_path / "audit.log", overrides_path=overrides)
+    assert logger.count_human_overrides() == 2
+
+
+def test_in_memory_audit_log_rejects_git() -> None:
+    import io
+
+    import pytest
+
+    with pytest.raises(ValueError):
+        AuditLogger(io.StringIO(), use_git=True)
+
+
+def test_audit_logger_configurable_hasher(tmp_path: Path) -> None:
+    import hashlib
+
+    import pytest
+
+    logger = AuditLogger(tmp_path / "audit.log", hasher="blake2b")
+    logger.log("update_state", {"issue": 1})
+    entry = next(logger.iter_logs())
+    expected = hashlib.blake2b(
+        json.dumps({"issue": 1}, sort_keys=True).encode()
+    ).hexdigest()[:8]
+    assert entry["diff_hash"] == expected
+    with pytest.raises(ValueError):
+        AuditLogger(tmp_path / "other.log", hasher="no-such-hash")
@@ -3,14 +3,47 @@ Basic tests for the Autonomy core package.
 """
 
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
 
 import pytest
 
 # Import the main classes
-from src import WorkflowConfig, WorkflowManager
-from src.core.agents import BaseAgent, PMAgent, QAAgent, SDEAgent
-from src.github.issue_manager import IssueManager
+from src import (
+    BaseAgent,
+    IssueManager,
+    PMAgent,
+    QAAgent,
+    SDEAgent,
+    WorkflowConfig,
+    WorkflowManager,
+    create_workflow_manager,
+)
+
+
+class DummyResponse:
+    def __init__(self, status_code=200, json_data=None):
+        self.status_code = status_code
+        self._json = json_data if json_data is not None else {}
+
+    def json(self):
+        return self._json
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Shared default configuration; tests must not mutate it."""
+    return WorkflowConfig()
+
+
+@pytest.fixture
+def stub_issue_manager(monkeypatch):
+    """Replace the IssueManager built by WorkflowManager with a plain stub."""
+
+    def stub(token, owner, repo, **kwargs):
+        return SimpleNamespace(github_token=token, owner=owner, repo=repo, **kwargs)
+
+    monkeypatch.setattr("src.github.issue_manager.IssueManager", stub)
+    return stub
 
 
 class TestWorkflowConfig:
@@ -27,6 +60,7 @@ class TestWorkflowConfig:
         assert config.board_cache_path.endswith("field_cache.json")
         assert config.hierarchy_orphan_threshold == 3
         assert config.hierarchy_sync_cooldown == 60
+        assert config.issues_cache_ttl == 30
 
     def test_custom_config(self):
         """Test custom configuration values."""
@@ -59,33 +93,33 @@ class TestWorkflowConfig:
 class TestAgents:
     """Test agent functionality."""
 
-    def test_base_agent(self):
+    def test_base_agent(self, default_config):
         """Test BaseAgent initialization."""
-        config = WorkflowConfig()
+        config = default_config
         agent = BaseAgent(config)
 
         assert agent.config == config
         assert agent.role == "base"
 
-    def test_pm_agent(self):
+    def test_pm_agent(self, default_config):
         """Test PMAgent initialization."""
-        config = WorkflowConfig()
+        config = default_config
         agent = PMAgent(config)
 
         assert agent.role == "pm"
         assert "product manager" in agent.system_prompt.lower()
 
-    def test_sde_agent(self):
+    def test_sde_agent(self, default_config):
         """Test SDEAgent initialization."""
-        config = WorkflowConfig()
+        config = default_config
         agent = SDEAgent(config)
 
         assert agent.role == "sde"
         assert "software development" in agent.system_prompt.lower()
 
-    def test_qa_agent(self):
+    def test_qa_agent(self, default_config):
         """Test QAAgent initialization."""
-        config = WorkflowConfig()
+        config = default_config
         agent = QAAgent(config)
 
         assert agent.role == "qa"
@@ -95,13 +129,10 @@ class TestAgents:
 class TestIssueManager:
     """Test IssueManager functionality."""
 
-    @patch("requests.get")
-    @patch("requests.post")
-    def test_issue_manager_init(self, mock_post, mock_get):
+    def test_issue_manager_init(self, monkeypatch):
         """Test IssueManager initialization."""
-        # Mock GitHub API responses
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = []
+        monkeypatch.setattr("requests.get", lambda *a, **k: DummyResponse(200, []))
+        monkeypatch.setattr("requests.post", lambda *a, **k: DummyResponse(201))
 
         manager = IssueManager("fake_token", "owner", "repo")
 
@@ -109,14 +140,10 @@ class TestIssueManager:
         assert manager.owner == "owner"
         assert manager.repo == "repo"
 
-    @patch("requests.get")
-    def test_list_issues(self, mock_get):
+    def test_list_issues(self, monkeypatch):
         """Test listing issues."""
-        # Mock GitHub API response
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = [
-            {"number": 1, "title": "Test Issue", "state": "open"}
-        ]
+        payload = [{"number": 1, "title": "Test Issue", "state": "open"}]
+        monkeypatch.setattr("requests.get", lambda *a, **k: DummyResponse(200, payload))
 
         manager = IssueManager("fake_token", "owner", "repo")
         issues = manager.list_issues()
@@ -128,10 +155,9 @@ class TestIssueManager:
 class TestWorkflowManager:
     """Test WorkflowManager functionality."""
 
-    @patch("src.github.issue_manager.IssueManager")
-    def test_workflow_manager_init(self, mock_issue_manager):
+    def test_workflow_manager_init(self, default_config, stub_issue_manager):
         """Test WorkflowManager initialization."""
-        config = WorkflowConfig()
+        config = default_config
         manager = WorkflowManager(
             github_token="fake_token", owner="owner", repo="repo", config=config
         )
@@ -140,11 +166,11 @@ class TestWorkflowManager:
         assert manager.owner == "owner"
         assert manager.repo == "repo"
         assert manager.config == config
+        assert isinstance(manager.issue_manager, SimpleNamespace)
 
-    @patch("src.github.issue_manager.IssueManager")
-    def test_get_agents(self, mock_issue_manager):
+    def test_get_agents(self, default_config, stub_issue_manager):
         """Test agent creation."""
-        config = WorkflowConfig()
+        config = default_config
         manager = WorkflowManager(
             github_token="fake_token", owner="owner", repo="repo", config=config
         )
@@ -163,16 +189,6 @@ class TestIntegration:
 
     def test_package_imports(self):
         """Test that all main classes can be imported."""
-        from src import (
-            BaseAgent,
-            IssueManager,
-            PMAgent,
-            QAAgent,
-            SDEAgent,
-            WorkflowConfig,
-            WorkflowManager,
-        )
-
         # Basic instantiation test
         config = WorkflowConfig()
         assert isinstance(config, WorkflowConfig)
@@ -189,19 +205,16 @@ class TestIntegration:
             assert hasattr(agent, "config")
             assert hasattr(agent, "role")
 
-    def test_convenience_functions(self):
+    def test_convenience_functions(self, stub_issue_manager):
         """Test convenience functions."""
-        from src import create_workflow_manager
-
-        with patch("src.github.issue_manager.IssueManager"):
-            manager = create_workflow_manager(
-                github_token="fake_token",
-                owner="owner",
-                repo="repo",
-                max_file_lines=500,
-            )
+        manager = create_workflow_manager(
+            github_token="fake_token",
+            owner="owner",
+            repo="repo",
+            max_file_lines=500,
+        )
 
-            assert manager.config.max_file_lines == 500
+        assert manager.config.max_file_lines == 500
 
 
 def test_config_validation_error():
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from src.tasks.backlog_doctor import BacklogDoctor
 
 
@@ -7,8 +9,10 @@ class DummyIssueManager:
     def __init__(self, issues):
         self._issues = issues
         self.labeled = []
+        self.fetches = 0
 
     def list_issues(self, state="open"):
+        self.fetches += 1
         return self._issues
 
     def update_issue_labels(self, issue_number, add_labels=None, remove_labels=None):
@@ -30,13 +34,22 @@ def test_find_stale_issues():
 
 def test_find_oversized_issues():
     body = "\n".join(["- [ ] item" for _ in range(11)])
-    issues = [_make_issue(1, body=body), _make_issue(2, body="- [ ] one")]
+    issues = [
+        _make_issue(1, body=body),
+        _make_issue(2, body="- [ ] one"),
+        _make_issue(3, body="intro\n  - [x] nested\n" + "text - [ ] inline\n" * 11),
+    ]
     doctor = BacklogDoctor(DummyIssueManager(issues))
     over = doctor.find_oversized_issues(limit=10)
     assert [i["number"] for i in over] == [1]
 
 
-def test_find_duplicate_candidates():
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_find_duplicate_candidates(monkeypatch, use_rapidfuzz):
+    if use_rapidfuzz:
+        pytest.importorskip("rapidfuzz")
+    else:
+        monkeypatch.setattr("src.tasks.backlog_doctor.process", None)
     issues = [
         _make_issue(1, title="Add login"),
         _make_issue(2, title="Add login page"),
@@ -46,6 +59,78 @@ def test_find_duplicate_candidates():
     dupes = doctor.find_duplicate_candidates(threshold=0.8)
     pairs = {(a["number"], b["number"]) for a, b, _ in dupes}
     assert (1, 2) in pairs
+    assert all(0.8 <= sim <= 1.0 for _, _, sim in dupes)
+
+
+def test_rapidfuzz_compares_blocked_bodies_only(monkeypatch):
+    fuzz = pytest.importorskip("rapidfuzz.fuzz")
+    monkeypatch.setattr("src.tasks.backlog_doctor.BLOCK_MAX_ISSUES", 2)
+    body = "crash when saving draft"
+    issues = [
+        _make_issue(1, title="Editor bug", body=body),
+        _make_issue(2, title="Unrelated title", body=body + "s"),
+        _make_issue(3, title="Something else", body="when saving"),
+        _make_issue(4, title="Another one", body="when saving"),
+        _make_issue(5, title="Last issue", body="saving when"),
+    ]
+    compared = []
+    ratio = fuzz.ratio
+
+    def spy(a, b, **kwargs):
+        compared.append((a, b))
+        return ratio(a, b, **kwargs)
+
+    monkeypatch.setattr(fuzz, "ratio", spy)
+    doctor = BacklogDoctor(DummyIssueManager(issues))
+    dupes = doctor.find_duplicate_candidates(threshold=0.9)
+    assert [(a["number"], b["number"]) for a, b, _ in dupes] == [(1, 2), (3, 4)]
+    # "when" and "saving" appear in too many bodies to block on
+    assert ("when saving", "saving when") not in compared
+
+
+class InlineExecutor:
+    instances = []
+
+    def __init__(self, workers, mp_context=None):
+        self.workers = workers
+        self.mp_context = mp_context
+        self.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+
+def test_find_duplicate_candidates_parallel(monkeypatch):
+    monkeypatch.setattr("src.tasks.backlog_doctor.process", None)
+    monkeypatch.setattr("src.tasks.backlog_doctor.PARALLEL_MIN_ISSUES", 0)
+    monkeypatch.setattr("src.tasks.backlog_doctor.PARALLEL_ROWS_PER_WORKER", 2)
+    monkeypatch.setattr("src.tasks.backlog_doctor.os.cpu_count", lambda: 8)
+    monkeypatch.setattr("src.tasks.backlog_doctor.ProcessPoolExecutor", InlineExecutor)
+    InlineExecutor.instances.clear()
+    titles = [
+        "Add login page",
+        "Fix crash on start",
+        "Add login pages",
+        "Fix crash at start",
+    ]
+    bodies = ["alpha", "bravo charlie", "delta echo foxtrot", "golf"]
+    issues = [
+        _make_issue(n, title=title, body=body)
+        for n, (title, body) in enumerate(zip(titles, bodies), 1)
+    ]
+    doctor = BacklogDoctor(DummyIssueManager(issues))
+    dupes = doctor.find_duplicate_candidates(threshold=0.8)
+    assert [(a["number"], b["number"]) for a, b, _ in dupes] == [(1, 3), (2, 4)]
+    # Four rows at two per worker caps the pool at two workers
+    [pool] = InlineExecutor.instances
+    assert pool.workers == 2
+    assert pool.mp_context.get_start_method() == "spawn"
 
 
 def test_run_applies_labels():
@@ -56,7 +141,8 @@ def test_run_applies_labels():
     result = doctor.run()
     assert result["stale"] == [1]
     assert result["oversized"] == [1]
-    assert mgr.labeled  # labels applied
+    assert mgr.labeled == [(1, ["stale", "oversized"], None)]
+    assert mgr.fetches == 1
 
 
 class DummySlackBot:
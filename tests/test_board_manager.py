@@ -11,42 +11,49 @@ class DummyResponse:
         return self._data
 
 
-def test_init_board_creates_fields(tmp_path, monkeypatch):
-    calls = []
+# Responses for a repository without an existing board, keyed by operation
+NEW_BOARD = {
+    "RepoProjects": {
+        "data": {"repository": {"id": "rid", "projectsV2": {"nodes": []}}}
+    },
+    "CreateProject": {"data": {"createProjectV2": {"projectV2": {"id": "pid"}}}},
+    "GetFields": {"data": {"node": {"fields": {"nodes": []}}}},
+    "CreateField": {
+        "data": {"createProjectV2Field": {"projectV2Field": {"id": "fid"}}}
+    },
+    "FieldOptions": {"data": {"node": {"options": {"nodes": []}}}},
+    "AddFieldOption": {
+        "data": {
+            "addProjectV2FieldOption": {
+                "projectV2SingleSelectFieldOption": {"id": "oid"}
+            }
+        }
+    },
+}
+
+
+def _fake_graphql(responses, calls):
+    """Return a ``make_request`` stand-in answering by GraphQL operation name.
+
+    Values in ``responses`` are response payloads or callables taking the
+    request JSON and returning one.
+    """
 
     def dummy_post(self, method, url, headers=None, json=None, timeout=10):
-        query = json["query"]
-        calls.append(query)
-        if "RepoProjects" in query:
-            return DummyResponse(
-                {"data": {"repository": {"id": "rid", "projectsV2": {"nodes": []}}}}
-            )
-        if "CreateProject" in query:
-            return DummyResponse(
-                {"data": {"createProjectV2": {"projectV2": {"id": "pid"}}}}
-            )
-        if "GetFields" in query:
-            return DummyResponse({"data": {"node": {"fields": {"nodes": []}}}})
-        if "CreateField" in query:
-            return DummyResponse(
-                {"data": {"createProjectV2Field": {"projectV2Field": {"id": "fid"}}}}
-            )
-        if "FieldOptions" in query:
-            return DummyResponse({"data": {"node": {"options": {"nodes": []}}}})
-        if "AddFieldOption" in query:
-            return DummyResponse(
-                {
-                    "data": {
-                        "addProjectV2FieldOption": {
-                            "projectV2SingleSelectFieldOption": {"id": "oid"}
-                        }
-                    }
-                }
-            )
-        return DummyResponse({"data": {}})
+        # "query Name(...)" / "mutation Name(...)": the name is the second token
+        op = json["query"].split(None, 2)[1].split("(", 1)[0]
+        calls.append(op)
+        data = responses.get(op, {"data": {}})
+        return DummyResponse(data(json) if callable(data) else data)
+
+    return dummy_post
 
+
+def test_init_board_creates_fields(tmp_path, monkeypatch):
+    calls = []
     monkeypatch.setattr(
-        "src.github.client.ResilientGitHubClient.make_request", dummy_post
+        "src.github.client.ResilientGitHubClient.make_request",
+        _fake_graphql(NEW_BOARD, calls),
     )
     cache = tmp_path / "cache.json"
     bm = BoardManager("t", "o", "r", cache_path=cache)
@@ -54,51 +61,44 @@ def test_init_board_creates_fields(tmp_path, monkeypatch):
     assert set(result) == {"Priority", "Pinned", "Sprint", "Track"}
     assert cache.exists()
     # ensure create project and field queries issued
-    assert any("CreateProject" in q for q in calls)
-    assert any("CreateField" in q for q in calls)
+    assert "CreateProject" in calls
+    assert "CreateField" in calls
+    # new fields start empty so options are added without querying them
+    assert "FieldOptions" not in calls
 
 
 def test_init_board_uses_existing(tmp_path, monkeypatch):
-    calls = []
-
-    def dummy_post(self, method, url, headers=None, json=None, timeout=10):
-        query = json["query"]
-        calls.append(query)
-        if "RepoProjects" in query:
-            return DummyResponse(
-                {
-                    "data": {
-                        "repository": {
-                            "id": "rid",
-                            "projectsV2": {
-                                "nodes": [{"id": "pid", "title": "Autonomy Board"}]
-                            },
-                        }
-                    }
+    def field_options(json):
+        opts = (
+            ["P0", "P1", "P2", "P3"]
+            if "id1" in json.get("variables", {}).get("fieldId", "")
+            else ["Yes", "No"]
+        )
+        return {"data": {"node": {"options": {"nodes": [{"name": o} for o in opts]}}}}
+
+    def add_field_option(json):
+        raise AssertionError("Should not add options for existing fields")
+
+    fields = [
+        {"id": f"id{i}", "name": name}
+        for i, name in enumerate(["Priority", "Pinned", "Sprint", "Track"], 1)
+    ]
+    responses = {
+        "RepoProjects": {
+            "data": {
+                "repository": {
+                    "id": "rid",
+                    "projectsV2": {"nodes": [{"id": "pid", "title": "Autonomy Board"}]},
                 }
-            )
-        if "GetFields" in query:
-            nodes = [
-                {"id": f"id{i}", "name": name}
-                for i, name in enumerate(["Priority", "Pinned", "Sprint", "Track"], 1)
-            ]
-            return DummyResponse({"data": {"node": {"fields": {"nodes": nodes}}}})
-        if "FieldOptions" in query:
-            opts = [
-                {"name": opt}
-                for opt in (
-                    ["P0", "P1", "P2", "P3"]
-                    if "id1" in json.get("variables", {}).get("fieldId", "")
-                    else ["Yes", "No"]
-                )
-            ]
-            return DummyResponse({"data": {"node": {"options": {"nodes": opts}}}})
-        if "AddFieldOption" in query:
-            raise AssertionError("Should not add options for existing fields")
-        return DummyResponse({"data": {}})
-
+            }
+        },
+        "GetFields": {"data": {"node": {"fields": {"nodes": fields}}}},
+        "FieldOptions": field_options,
+        "AddFieldOption": add_field_option,
+    }
     monkeypatch.setattr(
-        "src.github.client.ResilientGitHubClient.make_request", dummy_post
+        "src.github.client.ResilientGitHubClient.make_request",
+        _fake_graphql(responses, []),
     )
     cache = tmp_path / "cache.json"
     bm = BoardManager("t", "o", "r", cache_path=cache)
@@ -110,29 +110,9 @@ def test_init_board_uses_existing(tmp_path, monkeypatch):
 def test_default_cache_path(monkeypatch, tmp_path):
     monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
 
-    calls = []
-
-    def dummy_post(self, method, url, headers=None, json=None, timeout=10):
-        query = json["query"]
-        calls.append(query)
-        if "RepoProjects" in query:
-            return DummyResponse(
-                {"data": {"repository": {"id": "rid", "projectsV2": {"nodes": []}}}}
-            )
-        if "CreateProject" in query:
-            return DummyResponse(
-                {"data": {"createProjectV2": {"projectV2": {"id": "pid"}}}}
-            )
-        if "GetFields" in query:
-            return DummyResponse({"data": {"node": {"fields": {"nodes": []}}}})
-        if "CreateField" in query:
-            return DummyResponse(
-                {"data": {"createProjectV2Field": {"projectV2Field": {"id": "fid"}}}}
-            )
-        return DummyResponse({"data": {}})
-
     monkeypatch.setattr(
-        "src.github.client.ResilientGitHubClient.make_request", dummy_post
+        "src.github.client.ResilientGitHubClient.make_request",
+        _fake_graphql(NEW_BOARD, []),
     )
     bm = BoardManager("t", "o", "r")
     bm.init_board()
@@ -1,7 +1,6 @@
 from types import SimpleNamespace
 
 from src.cli.main import cmd_auth
-from src.core.secret_vault import SecretVault
 
 
 class DummyResponse:
@@ -24,20 +23,20 @@ class DummyStorage:
         return self.token
 
 
-def test_cmd_auth_slack(monkeypatch, tmp_path):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
+def test_cmd_auth_slack(monkeypatch, vault):
     vault.set_secret("slack_token", "tok")
 
     def dummy_post(url, headers=None, timeout=10):
         return DummyResponse(200, {"ok": True, "team": "workspace"})
 
-    monkeypatch.setattr("requests.post", dummy_post)
+    monkeypatch.setattr(
+        "src.slack._get_session", lambda: SimpleNamespace(post=dummy_post)
+    )
     args = SimpleNamespace(action="slack", token=None, slack_token=None, install=False)
     assert cmd_auth(vault, args) == 0
 
 
-def test_cmd_auth_login(tmp_path, monkeypatch):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
+def test_cmd_auth_login(vault, monkeypatch):
 
     class DummyStorage:
         def store_token(self, *a, **kw):
@@ -53,8 +52,7 @@ def test_cmd_auth_login(tmp_path, monkeypatch):
     assert vault.get_secret("slack_token") == "s"
 
 
-def test_cmd_auth_login_oauth(monkeypatch, tmp_path):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
+def test_cmd_auth_login_oauth(monkeypatch, vault):
 
     class DummyFlow:
         def __init__(self, cid):
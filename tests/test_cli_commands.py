@@ -1,5 +1,7 @@
 from pathlib import Path
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
 
 import src.cli.main as main
 from src.cli.main import (
@@ -39,11 +41,13 @@ class DummyResponse:
 
 
 class DummyIssueManager:
+    # Read-only and shared; tests needing other issues assign their own dict
+    issues = MappingProxyType({5: {"title": "t"}})
+
     def __init__(self):
         self.labels = None
         self.state = None
         self.comment = None
-        self.issues = {5: {"title": "t"}}
 
     def update_issue_labels(self, issue_number, add_labels=None, remove_labels=None):
         self.labels = (issue_number, add_labels, remove_labels)
@@ -79,11 +83,20 @@ class DummyManager:
         self.setup_called = False
         self.process_issue_called_with = None
         self.config = WorkflowConfig(board_cache_path=str(workspace / "cache.json"))
-        from src.audit.logger import AuditLogger
-
-        self.audit_logger = AuditLogger(workspace / "audit.log", use_git=True)
+        self._audit_logger = None
         self.issue_manager = DummyIssueManager()
 
+    @property
+    def audit_logger(self):
+        # Created on first use: ``use_git=True`` runs ``git init``
+        if self._audit_logger is None:
+            from src.audit.logger import AuditLogger
+
+            self._audit_logger = AuditLogger(
+                self.workspace_path / "audit.log", use_git=True
+            )
+        return self._audit_logger
+
     def setup_repository(self):
         self.setup_called = True
 
@@ -92,71 +105,81 @@ class DummyManager:
         return {"status": "completed", "phases_completed": ["pm_agent"]}
 
 
-def test_cmd_setup_success(tmp_path: Path):
-    manager = DummyManager(tmp_path)
-    args = SimpleNamespace(skip_docs=False)
-    assert cmd_setup(manager, args) == 0
-    assert manager.setup_called
+@pytest.fixture
+def manager(tmp_path: Path) -> DummyManager:
+    return DummyManager(tmp_path)
 
 
-def test_cmd_setup_error(tmp_path: Path):
-    manager = DummyManager(tmp_path)
+@pytest.fixture
+def stub_task_manager(monkeypatch):
+    """Return a function installing ``tm`` as the TaskManager the CLI builds."""
 
-    def fail():
-        raise RuntimeError("boom")
+    def install(tm):
+        monkeypatch.setattr("src.tasks.task_manager.TaskManager", lambda *a, **kw: tm)
+        return tm
 
-    manager.setup_repository = fail
-    args = SimpleNamespace(skip_docs=False)
-    assert cmd_setup(manager, args) == 1
+    return install
 
 
-def test_cmd_process_success(tmp_path: Path):
-    manager = DummyManager(tmp_path)
-    args = SimpleNamespace(issue=1)
-    assert cmd_process(manager, args) == 0
-    assert manager.process_issue_called_with == 1
+def _fail():
+    raise RuntimeError("boom")
+
+
+@pytest.mark.parametrize("fail, expected", [(False, 0), (True, 1)])
+def test_cmd_setup(manager, fail, expected):
+    if fail:
+        manager.setup_repository = _fail
+    args = SimpleNamespace(skip_docs=False)
+    assert cmd_setup(manager, args) == expected
+    assert manager.setup_called is not fail
 
 
-def test_cmd_process_error(tmp_path: Path):
-    manager = DummyManager(tmp_path)
-    manager.process_issue = lambda n: {"error": "bad"}
+@pytest.mark.parametrize(
+    "result, expected",
+    [(None, 0), ({"error": "bad"}, 1)],
+)
+def test_cmd_process(manager, result, expected):
+    if result is not None:
+        manager.process_issue = lambda n: result
     args = SimpleNamespace(issue=1)
-    assert cmd_process(manager, args) == 1
+    assert cmd_process(manager, args) == expected
+    if result is None:
+        assert manager.process_issue_called_with == 1
 
 
-def test_cmd_init_success(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
+@pytest.mark.parametrize("fail, expected", [(False, 0), (True, 1)])
+def test_cmd_init(monkeypatch, manager, fail, expected):
     monkeypatch.setattr("src.cli.main._create_web_template", lambda p: None)
     monkeypatch.setattr("src.cli.main._create_api_template", lambda p: None)
     monkeypatch.setattr("src.cli.main._create_cli_template", lambda p: None)
     monkeypatch.setattr("src.cli.main._create_library_template", lambda p: None)
+    if fail:
+        manager.setup_repository = _fail
     args = SimpleNamespace(template="web")
-    assert cmd_init(manager, args) == 0
-    assert manager.setup_called
-
+    assert cmd_init(manager, args) == expected
+    assert manager.setup_called is not fail
 
-def test_cmd_init_error(tmp_path: Path):
-    manager = DummyManager(tmp_path)
 
-    def fail():
-        raise RuntimeError("boom")
+def test_cmd_init_dispatches_template(monkeypatch, manager):
+    created = []
+    for name in ("web", "api", "cli", "library"):
+        monkeypatch.setattr(
+            f"src.cli.main._create_{name}_template",
+            lambda p, name=name: created.append(name),
+        )
+    for template in ("api", "cli", "unknown"):
+        assert cmd_init(manager, SimpleNamespace(template=template)) == 0
+    assert created == ["api", "cli", "library"]
 
-    manager.setup_repository = fail
-    args = SimpleNamespace(template="web")
-    assert cmd_init(manager, args) == 1
 
-
-def test_cmd_status(tmp_path: Path):
-    manager = DummyManager(tmp_path)
+def test_cmd_status(manager):
     args = SimpleNamespace(issue=None)
     assert cmd_status(manager, args) == 0
     args_issue = SimpleNamespace(issue=5)
     assert cmd_status(manager, args_issue) == 0
 
 
-def test_cmd_next(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
-
+def test_cmd_next(stub_task_manager, manager):
     class DummyTM:
         def get_next_task(self, assignee=None, team=None, explain=False):
             issue = {
@@ -171,16 +194,12 @@ def test_cmd_next(monkeypatch, tmp_path: Path):
         def _score_issue(self, issue, explain=False):
             return 5
 
-    monkeypatch.setattr(
-        "src.tasks.task_manager.TaskManager", lambda *a, **kw: DummyTM()
-    )
+    stub_task_manager(DummyTM())
     args = SimpleNamespace(assignee=None, team=None)
     assert cmd_next(manager, args) == 0
 
 
-def test_cmd_update(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
-
+def test_cmd_update(stub_task_manager, manager):
     class DummyTM:
         def __init__(self):
             self.called = None
@@ -189,16 +208,13 @@ def test_cmd_update(monkeypatch, tmp_path: Path):
             self.called = (issue_number, status, done, notes)
             return True
 
-    dummy = DummyTM()
-    monkeypatch.setattr("src.tasks.task_manager.TaskManager", lambda *a, **kw: dummy)
+    dummy = stub_task_manager(DummyTM())
     args = SimpleNamespace(issue=3, status="in-progress", done=False, notes=None)
     assert cmd_update(manager, args) == 0
     assert dummy.called == (3, "in-progress", False, None)
 
 
-def test_cmd_next_none(monkeypatch, tmp_path: Path, capsys):
-    manager = DummyManager(tmp_path)
-
+def test_cmd_next_none(stub_task_manager, manager, capsys):
     class DummyTM:
         def get_next_task(self, assignee=None, team=None, explain=False):
             return (None, {}) if explain else None
@@ -206,18 +222,14 @@ def test_cmd_next_none(monkeypatch, tmp_path: Path, capsys):
         def _score_issue(self, issue, explain=False):  # pragma: no cover - not called
             return 0
 
-    monkeypatch.setattr(
-        "src.tasks.task_manager.TaskManager", lambda *a, **kw: DummyTM()
-    )
+    stub_task_manager(DummyTM())
     args = SimpleNamespace(assignee=None, team=None)
     assert cmd_next(manager, args) == 0
     out = capsys.readouterr().out
     assert "No tasks found" in out
 
 
-def test_cmd_list(monkeypatch, tmp_path: Path, capsys):
-    manager = DummyManager(tmp_path)
-
+def test_cmd_list(stub_task_manager, manager, capsys):
     class DummyTM:
         def list_tasks(self, assignee=None, team=None):
             return [
@@ -225,17 +237,14 @@ def test_cmd_list(monkeypatch, tmp_path: Path, capsys):
                 {"number": 2, "title": "task b"},
             ]
 
-    monkeypatch.setattr(
-        "src.tasks.task_manager.TaskManager", lambda *a, **kw: DummyTM()
-    )
+    stub_task_manager(DummyTM())
     args = SimpleNamespace(assignee=None, team=None, mine=False, pinned=False)
     assert cmd_list(manager, args) == 0
     out = capsys.readouterr().out
     assert "#1" in out and "task a" in out
 
 
-def test_cmd_board_init(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
+def test_cmd_board_init(monkeypatch, manager):
     captured = {}
 
     class DummyBM:
@@ -252,8 +261,7 @@ def test_cmd_board_init(monkeypatch, tmp_path: Path):
     assert Path(captured["path"]) == Path(manager.config.board_cache_path)
 
 
-def test_cmd_board_init_custom_path(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
+def test_cmd_board_init_custom_path(monkeypatch, tmp_path: Path, manager):
     custom = tmp_path / "custom.json"
     manager.config.board_cache_path = str(custom)
     captured = {}
@@ -274,8 +282,7 @@ def test_cmd_board_init_custom_path(monkeypatch, tmp_path: Path):
     assert custom.exists()
 
 
-def test_cmd_board_init_arg_cache(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
+def test_cmd_board_init_arg_cache(monkeypatch, tmp_path: Path, manager):
     captured = {}
 
     class DummyBM:
@@ -293,9 +300,7 @@ def test_cmd_board_init_arg_cache(monkeypatch, tmp_path: Path):
     assert Path(captured["path"]) == via_arg
 
 
-def test_cmd_board_rank(monkeypatch, tmp_path: Path, capsys):
-    manager = DummyManager(tmp_path)
-
+def test_cmd_board_rank(monkeypatch, manager, capsys):
     class DummyBM:
         def __init__(self, *a, **kw):
             pass
@@ -311,8 +316,7 @@ def test_cmd_board_rank(monkeypatch, tmp_path: Path, capsys):
     assert "#1" in out and "A" in out
 
 
-def test_cmd_board_reorder(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
+def test_cmd_board_reorder(monkeypatch, manager):
     called = {}
 
     class DummyBM:
@@ -329,8 +333,7 @@ def test_cmd_board_reorder(monkeypatch, tmp_path: Path):
     assert called.get("done")
 
 
-def test_cmd_doctor_run(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
+def test_cmd_doctor_run(monkeypatch, manager):
     manager.issue_manager = object()
 
     class DummyDoctor:
@@ -352,9 +355,7 @@ def test_cmd_doctor_run(monkeypatch, tmp_path: Path):
     assert cmd_doctor(manager, args) == 0
 
 
-def test_cmd_doctor_nightly(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
-
+def test_cmd_doctor_nightly(monkeypatch, manager):
     class DummyScheduler:
         def __init__(self, bot):
             self.called = False
@@ -392,9 +393,7 @@ def test_cmd_doctor_nightly(monkeypatch, tmp_path: Path):
     assert cmd_doctor_nightly(manager, SecretVault(), args) == 0
 
 
-def test_cmd_metrics_daily(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
-
+def test_cmd_metrics_daily(monkeypatch, manager):
     class DummyService:
         def __init__(self, mapping, token, slack_token, run_time="09:00", **kw):
             self.called = False
@@ -414,8 +413,7 @@ def test_cmd_metrics_daily(monkeypatch, tmp_path: Path):
     assert cmd_metrics_daily(manager, SecretVault(), args) == 0
 
 
-def test_cmd_audit_and_undo(tmp_path: Path):
-    manager = DummyManager(tmp_path)
+def test_cmd_audit_and_undo(manager):
     # simulate an operation by logging directly
     h = manager.audit_logger.log(
         "update_labels", {"issue": 1, "add_labels": ["a"], "remove_labels": None}
@@ -427,8 +425,7 @@ def test_cmd_audit_and_undo(tmp_path: Path):
     assert manager.issue_manager.labels == (1, [], ["a"])
 
 
-def test_cmd_audit_shadow_pr(tmp_path: Path):
-    manager = DummyManager(tmp_path)
+def test_cmd_audit_shadow_pr(manager):
     manager.audit_logger.log(
         "update_labels", {"issue": 1, "add_labels": ["a"], "remove_labels": None}
     )
@@ -439,8 +436,7 @@ def test_cmd_audit_shadow_pr(tmp_path: Path):
     )
 
 
-def test_cmd_undo_commit_window_override(tmp_path: Path):
-    manager = DummyManager(tmp_path)
+def test_cmd_undo_commit_window_override(manager):
     h1 = manager.audit_logger.log(
         "update_labels", {"issue": 1, "add_labels": ["a"], "remove_labels": None}
     )
@@ -453,9 +449,7 @@ def test_cmd_undo_commit_window_override(tmp_path: Path):
     assert cmd_undo(manager, args) == 0
 
 
-def test_cmd_pin_unpin_and_list(monkeypatch, tmp_path: Path, capsys):
-    manager = DummyManager(tmp_path)
-
+def test_cmd_pin_unpin_and_list(monkeypatch, manager, capsys):
     args_pin = SimpleNamespace(issue=5)
     assert cmd_pin(manager, args_pin) == 0
     args_list = SimpleNamespace(assignee=None, team=None, mine=False, pinned=True)
@@ -474,8 +468,7 @@ def test_cmd_completion(tmp_path: Path, capsys):
     assert "register-python-argcomplete" in out
 
 
-def test_cmd_interactive(monkeypatch, tmp_path: Path, capsys):
-    manager = DummyManager(tmp_path)
+def test_cmd_interactive(monkeypatch, manager, capsys):
     parser = main.build_parser()
     inputs = iter(["help", "quit"])
     monkeypatch.setattr("builtins.input", lambda *a: next(inputs))
@@ -493,8 +486,7 @@ def test_cmd_configure(monkeypatch, tmp_path: Path):
     assert cfg_file.exists()
 
 
-def test_cmd_metrics_export(tmp_path: Path, capsys):
-    manager = DummyManager(tmp_path)
+def test_cmd_metrics_export(tmp_path: Path, capsys, manager):
     metrics_dir = tmp_path / "metrics"
     metrics_dir.mkdir()
     sample = metrics_dir / "o-r_2025-01-01.json"
@@ -507,9 +499,7 @@ def test_cmd_metrics_export(tmp_path: Path, capsys):
     assert "autonomy_time_to_task_avg" in out
 
 
-def test_cmd_hierarchy_sync(monkeypatch, tmp_path: Path):
-    manager = DummyManager(tmp_path)
-
+def test_cmd_hierarchy_sync(monkeypatch, manager):
     class DummyHM:
         def __init__(self, im, orphan_threshold=3):
             assert orphan_threshold == 3
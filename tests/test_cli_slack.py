@@ -1,7 +1,6 @@
 from types import SimpleNamespace
 
 from src.cli.main import cmd_auth, cmd_slack
-from src.core.secret_vault import SecretVault
 
 
 class DummyResponse:
@@ -14,8 +13,7 @@ class DummyResponse:
         return self._data
 
 
-def test_cmd_auth_slack_install(monkeypatch, tmp_path, capsys):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
+def test_cmd_auth_slack_install(monkeypatch, vault, capsys):
     monkeypatch.setenv("SLACK_CLIENT_ID", "cid")
     args = SimpleNamespace(action="slack", token=None, slack_token=None, install=True)
     assert cmd_auth(vault, args) == 0
@@ -23,27 +21,26 @@ def test_cmd_auth_slack_install(monkeypatch, tmp_path, capsys):
     assert "https://slack.com/oauth/v2/authorize" in out
 
 
-def test_cmd_auth_slack_token(tmp_path):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
+def test_cmd_auth_slack_token(vault):
     args = SimpleNamespace(action="slack", token=None, slack_token="tok", install=False)
     assert cmd_auth(vault, args) == 0
     assert vault.get_secret("slack_token") == "tok"
 
 
-def test_cmd_slack_test(monkeypatch, tmp_path):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
+def test_cmd_slack_test(monkeypatch, vault):
     vault.set_secret("slack_token", "tok")
 
     def dummy_post(url, headers=None, timeout=10):
         return DummyResponse({"ok": True})
 
-    monkeypatch.setattr("requests.post", dummy_post)
+    monkeypatch.setattr(
+        "src.slack._get_session", lambda: SimpleNamespace(post=dummy_post)
+    )
     args = SimpleNamespace(slack_cmd="test", token=None)
     assert cmd_slack(vault, args) == 0
 
 
-def test_cmd_slack_channels(monkeypatch, tmp_path, capsys):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
+def test_cmd_slack_channels(monkeypatch, vault, capsys):
     vault.set_secret("slack_token", "tok")
 
     def dummy_get(url, headers=None, timeout=10):
@@ -56,8 +53,7 @@ def test_cmd_slack_channels(monkeypatch, tmp_path, capsys):
     assert "gen" in out
 
 
-def test_cmd_slack_notify(monkeypatch, tmp_path):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
+def test_cmd_slack_notify(monkeypatch, vault):
     vault.set_secret("slack_token", "tok")
 
     def dummy_post(url, json=None, headers=None, timeout=10):
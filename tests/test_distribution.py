@@ -1,8 +1,50 @@
-from src.utils.distribution import check_for_updates, verify_installation
+from src.utils.distribution import (
+    check_for_updates,
+    clear_verification_cache,
+    verify_installation,
+)
 
 
 def test_verify_installation():
     assert verify_installation()
+    assert verify_installation(deep=True)
+
+
+def test_verify_installation_missing_module(monkeypatch):
+    monkeypatch.setattr(
+        "src.utils.distribution._REQUIRED_MODULES", ("src.no_such_pkg.main",)
+    )
+    assert not verify_installation()
+    assert not verify_installation(deep=True)
+
+
+def test_verify_installation_is_cached(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        "importlib.util.find_spec", lambda name: calls.append(name) or object()
+    )
+    clear_verification_cache()
+    try:
+        assert verify_installation()
+        assert verify_installation()
+        assert len(calls) == 2
+        clear_verification_cache()
+        assert verify_installation()
+        assert len(calls) == 4
+    finally:
+        clear_verification_cache()
+
+
+def test_verify_installation_failure_not_cached(monkeypatch):
+    found = []
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: found and object())
+    clear_verification_cache()
+    try:
+        assert not verify_installation()
+        found.append(True)
+        assert verify_installation()
+    finally:
+        clear_verification_cache()
 
 
 def test_check_for_updates(monkeypatch):
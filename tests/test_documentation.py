@@ -1,7 +1,8 @@
-import subprocess
-import sys
+import importlib.util
 from pathlib import Path
 
+import pytest
+
 DOCS = [
     "docs/USER_GUIDE.md",
     "docs/INSTALLATION.md",
@@ -16,22 +17,19 @@ MAIN_DOCS = [
 ]
 
 
-def test_docs_exist():
-    for doc in DOCS:
-        assert Path(doc).exists(), f"missing {doc}"
-
-
-def test_main_docs_exist():
-    for doc in MAIN_DOCS:
-        assert Path(doc).exists(), f"missing {doc}"
+@pytest.mark.parametrize("doc", DOCS + MAIN_DOCS)
+def test_doc_exists(doc):
+    assert Path(doc).is_file(), f"missing {doc}"
 
 
-def test_generate_docs_script(tmp_path: Path):
-    output = tmp_path / "api.md"
-    result = subprocess.run(
-        [sys.executable, "scripts/generate_docs.py", str(output)],
-        capture_output=True,
-        text=True,
+def test_generate_docs_script(tmp_path: Path, monkeypatch):
+    spec = importlib.util.spec_from_file_location(
+        "generate_docs", "scripts/generate_docs.py"
     )
-    assert result.returncode == 0
-    assert output.exists()
+    generate_docs = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generate_docs)
+    # The CLI help text itself is covered by test_installation
+    monkeypatch.setattr(generate_docs, "generate_cli_reference", lambda: "usage\n")
+    output = tmp_path / "api.md"
+    generate_docs.main(str(output))
+    assert "usage" in output.read_text()
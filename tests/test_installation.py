@@ -1,16 +1,16 @@
-import subprocess
-import sys
+import pytest
 
+import src.cli.main as main
 
-def test_cli_help_runs():
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "src.cli.main",
-            "--help",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-    assert result.returncode == 0
+
+def test_cli_help_runs(monkeypatch, capsys):
+    # ``main`` leaves through ``os._exit`` on --help; keep pytest alive
+    def fake_exit(code):
+        raise SystemExit(code)
+
+    monkeypatch.setattr(main.os, "_exit", fake_exit)
+    monkeypatch.setattr(main.sys, "argv", ["autonomy", "--help"])
+    with pytest.raises(SystemExit) as exc:
+        main.main()
+    assert exc.value.code == 0
+    assert "GitHub Workflow Manager" in capsys.readouterr().out
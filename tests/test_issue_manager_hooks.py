@@ -1,4 +1,4 @@
-from src.github.issue_manager import IssueManager
+from src.github.issue_manager import IssueManager, Milestone
 from src.tasks.task_manager import TaskManager
 
 
@@ -28,6 +28,16 @@ def test_on_change_called_update_labels(monkeypatch):
     assert called.get("cnt", 0) == 1
 
 
+def test_update_labels_skips_no_op(monkeypatch):
+    called = []
+    mgr = IssueManager("t", "o", "r", on_change=lambda: called.append("change"))
+    monkeypatch.setattr(mgr, "get_issue", lambda n: {"labels": [{"name": "x"}]})
+    monkeypatch.setattr("requests.patch", lambda *a, **k: called.append("patch"))
+    assert mgr.update_issue_labels(1, add_labels=["x"]) is True
+    assert mgr.update_issue_labels(1, remove_labels=["y"]) is True
+    assert called == []
+
+
 def test_on_change_called_update_state(monkeypatch):
     called = {}
     mgr = IssueManager(
@@ -67,3 +77,63 @@ def test_task_manager_auto_sync_on_issue_update(monkeypatch):
     )
     tm.issue_manager.update_issue_labels(1, add_labels=["x"])
     assert called.get("cnt", 0) == 1
+
+
+def test_create_milestone_payload():
+    sent = {}
+
+    class DummySession:
+        def post(self, url, headers=None, json=None):
+            sent.update(json)
+            return type(
+                "R", (), {"status_code": 201, "json": lambda s: {"number": 3}}
+            )()
+
+    mgr = IssueManager("t", "o", "r", session=DummySession())
+    assert mgr.create_milestone(Milestone("M1", "desc")) == 3
+    assert sent == {
+        "title": "M1",
+        "description": "desc",
+        "due_on": None,
+        "state": "open",
+    }
+
+
+def test_list_issues_conditional_sends_etag():
+    sent = []
+
+    class DummySession:
+        def get(self, url, headers=None, params=None):
+            sent.append(headers.get("If-None-Match"))
+            status = 304 if headers.get("If-None-Match") == "abc" else 200
+            return type(
+                "R",
+                (),
+                {
+                    "status_code": status,
+                    "headers": {"ETag": "abc"},
+                    "json": lambda s: [{"number": 1}],
+                },
+            )()
+
+    mgr = IssueManager("t", "o", "r", session=DummySession())
+    assert mgr.list_issues_conditional() == (200, "abc", [{"number": 1}])
+    assert mgr.list_issues_conditional(etag="abc") == (304, "abc", [])
+    assert sent == [None, "abc"]
+
+
+def test_list_issues_decodes_raw_content():
+    class DummySession:
+        def get(self, url, headers=None, params=None):
+            return type(
+                "R",
+                (),
+                {
+                    "status_code": 200,
+                    "content": b'[{"number": 7, "title": "t"}]',
+                    "json": lambda s: [{"number": 7, "title": "t"}],
+                },
+            )()
+
+    mgr = IssueManager("t", "o", "r", session=DummySession())
+    assert mgr.list_issues() == [{"number": 7, "title": "t"}]
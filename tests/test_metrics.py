@@ -1,7 +1,10 @@
 import json
+import os
 from datetime import date, datetime
 from pathlib import Path
 
+import pytest
+
 from src.metrics import MetricsCollector, MetricsStorage
 
 
@@ -59,13 +62,90 @@ def test_metrics_collection_and_storage(tmp_path: Path) -> None:
 
     report = collector.collect_daily_metrics("owner/repo")
     assert "Daily Team Metrics" in report
-    files = list((tmp_path / "metrics").glob("*.json"))
-    assert files
-    data = json.loads(files[0].read_text())
+    assert (tmp_path / "metrics" / "metrics.db").exists()
+    data = storage.get_latest_metrics("owner/repo")
+    assert data
     assert "orphan_issues_count" in data
     assert "undo_rate" in data
 
 
+def test_audit_counters_fetched_once(tmp_path: Path) -> None:
+    audit = DummyAudit()
+    calls = {"total": 0, "overrides": 0}
+
+    def count_ai_recommendations(days: int = 7) -> int:
+        calls["total"] += 1
+        return 10
+
+    def count_human_overrides() -> int:
+        calls["overrides"] += 1
+        return 1
+
+    audit.count_ai_recommendations = count_ai_recommendations  # type: ignore
+    audit.count_human_overrides = count_human_overrides  # type: ignore
+    collector = MetricsCollector(
+        DummyGitHub(), DummySlack(), audit, MetricsStorage(tmp_path)
+    )
+    collector.collect_daily_metrics("owner/repo")
+    assert calls == {"total": 1, "overrides": 1}
+    assert collector.calculate_override_rate() == 10.0
+
+
+def test_daily_report_cached_per_repo(tmp_path: Path) -> None:
+    audit = DummyAudit()
+    collector = MetricsCollector(
+        DummyGitHub(), DummySlack(), audit, MetricsStorage(tmp_path)
+    )
+    first = collector.collect_daily_metrics("owner/repo")
+    audit.count_command_usage = lambda cmd: 42  # type: ignore[assignment]
+    assert collector.collect_daily_metrics("owner/repo") == first
+    forced = collector.collect_daily_metrics("owner/repo", force=True)
+    assert "Planning commands used: 42" in forced
+    # Forcing re-stores even when nothing changed since the last report
+    assert collector.collect_daily_metrics("owner/repo", force=True) == forced
+
+
+def test_daily_report_cache_drops_earlier_days(tmp_path: Path) -> None:
+    import threading
+    from datetime import timedelta
+
+    collector = MetricsCollector(
+        DummyGitHub(), DummySlack(), DummyAudit(), MetricsStorage(tmp_path)
+    )
+    stale = ("owner/repo", date.today() - timedelta(days=1))
+    collector._daily_cache[stale] = "old"
+    collector._key_locks[stale] = threading.Lock()
+    collector.collect_daily_metrics("owner/repo")
+    assert list(collector._daily_cache) == [("owner/repo", date.today())]
+    assert list(collector._key_locks) == [("owner/repo", date.today())]
+
+
+def test_hierarchy_tree_reused_within_ttl(tmp_path: Path) -> None:
+    gh = DummyGitHub()
+    calls = []
+    original = gh.list_issues
+
+    def list_issues(state="open"):
+        calls.append(state)
+        return original(state)
+
+    gh.list_issues = list_issues  # type: ignore[assignment]
+    collector = MetricsCollector(
+        gh, DummySlack(), DummyAudit(), MetricsStorage(tmp_path)
+    )
+    assert collector.calculate_orphan_count() == 1
+    assert collector.calculate_orphan_count() == 1
+    assert len(calls) == 1
+    collector.TREE_TTL = 0
+    collector.calculate_orphan_count()
+    assert len(calls) == 2
+
+    manager = collector.hierarchy_manager
+    assert collector.hierarchy_manager is manager
+    collector.invalidate_hierarchy()
+    assert collector.hierarchy_manager is not manager
+
+
 def test_storage_filters_personal_data(tmp_path: Path) -> None:
     storage = MetricsStorage(tmp_path)
     metrics = {
@@ -74,21 +154,50 @@ def test_storage_filters_personal_data(tmp_path: Path) -> None:
         "loc_per_contributor": {"a": 100, "b": 200},
     }
     storage.store_daily_metrics("owner/repo", metrics)
-    stored = next((tmp_path / "metrics").glob("*.json")).read_text()
+    stored = storage.get_latest_metrics("owner/repo")
     assert "loc_per_contributor" not in stored
     assert "loc_per_assignee" in stored
 
 
+def test_storage_migrates_json_files(tmp_path: Path) -> None:
+    legacy = tmp_path / "metrics"
+    legacy.mkdir()
+    for day in ("2024-01-01", "2024-01-02"):
+        (legacy / f"owner-repo_{day}.json").write_text(
+            json.dumps({"date": day, "repository": "owner/repo", "undo_rate": 1})
+        )
+    storage = MetricsStorage(tmp_path)
+    assert storage.get_latest_metrics("owner/repo")["date"] == "2024-01-02"
+    assert not [name for name in os.listdir(legacy) if name.endswith(".json")]
+    assert storage.get_latest_metrics("other/repo") is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_storage_serializers_agree(tmp_path: Path, monkeypatch, use_orjson) -> None:
+    if not use_orjson:
+        monkeypatch.setattr("src.metrics.storage.orjson", None)
+    storage = MetricsStorage(tmp_path)
+    storage.store_daily_metrics(
+        "owner/repo",
+        {"date": date(2024, 1, 1), "repository": "owner/repo", "by_day": {1: 2}},
+    )
+    stored = storage.get_latest_metrics("owner/repo")
+    assert stored["date"] == "2024-01-01"
+    assert stored["by_day"] == {"1": 2}
+
+
 def test_export_prometheus(tmp_path: Path) -> None:
     storage = MetricsStorage(tmp_path)
     metrics = {
         "date": date.today(),
         "repository": "owner/repo",
         "time_to_task_avg": 5,
+        "hash": "0b504d32",
     }
     storage.store_daily_metrics("owner/repo", metrics)
     output = storage.export_prometheus()
     assert "autonomy_time_to_task_avg" in output
+    assert "autonomy_hash" not in output
 
 
 def test_metrics_trend(tmp_path: Path, monkeypatch) -> None:
@@ -114,8 +223,24 @@ def test_metrics_trend(tmp_path: Path, monkeypatch) -> None:
     audit.count_approvals = lambda days=7: 5  # type: ignore[assignment]
     collector.collect_daily_metrics("owner/repo")
 
-    files = sorted((tmp_path / "metrics").glob("*.json"))
-    data = json.loads(files[-1].read_text())
+    data = storage.get_latest_metrics("owner/repo")
+    assert data["date"] == "2024-01-02"
     assert data["wau_change_pct"] == 100.0
     assert data["approval_rate_change_pct"] == -37.5
     assert data["orphan_issues_change_pct"] == 0.0
+
+
+def test_unchanged_metrics_skip_store_and_post(tmp_path: Path, monkeypatch) -> None:
+    slack = DummySlack()
+    storage = MetricsStorage(tmp_path)
+    collector = MetricsCollector(DummyGitHub(), slack, DummyAudit(), storage)
+
+    class DummyDateTime:
+        now = staticmethod(lambda: datetime(2024, 1, 1))
+
+    monkeypatch.setattr("src.metrics.collector.datetime", DummyDateTime)
+    assert collector.send_daily_report("owner/repo", "C")
+    DummyDateTime.now = staticmethod(lambda: datetime(2024, 1, 2))
+    assert not collector.send_daily_report("owner/repo", "C")
+    assert len(slack.posted) == 1
+    assert storage.get_latest_metrics("owner/repo")["date"] == "2024-01-01"
@@ -16,3 +16,12 @@ def test_persistence(tmp_path: Path):
     store.pin_item("proj", "1")
     new_store = PinnedItemsStore(config_dir=tmp_path)
     assert new_store.is_pinned("proj", "1")
+
+
+def test_pinned_numbers(tmp_path: Path):
+    store = PinnedItemsStore(config_dir=tmp_path)
+    assert store.pinned_numbers("proj") == frozenset()
+    store.pin_item("proj", "1")
+    store.pin_item("proj", "2")
+    store.pin_item("other", "3")
+    assert store.pinned_numbers("proj") == frozenset({"1", "2"})
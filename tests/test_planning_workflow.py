@@ -2,12 +2,24 @@ import click
 import pytest
 
 from src.core.platform import AutonomyPlatform
+from src.planning.config import PlanningConfig
 from src.planning.workflow import PlanningWorkflow
 
 
-def test_planning_workflow_run():
-    platform = AutonomyPlatform()
-    wf = platform.create_workflow(PlanningWorkflow)
+@pytest.fixture(scope="module")
+def platform():
+    """Platform shared by the module; its mem0 backend is costly to build."""
+    return AutonomyPlatform()
+
+
+@pytest.fixture
+def wf(platform):
+    """Planning workflow on ``platform`` with repository memory reset."""
+    platform.memory.reset()
+    return platform.create_workflow(PlanningWorkflow)
+
+
+def test_planning_workflow_run(platform, wf):
     issue = {
         "title": "Add login",
         "labels": ["priority-high"],
@@ -26,10 +38,8 @@ def test_planning_workflow_run():
     assert platform.memory.store["default"].get("last_plan")
 
 
-def test_security_routing_and_assignment():
-    platform = AutonomyPlatform()
+def test_security_routing_and_assignment(platform, wf):
     platform.memory.add({"team_members": "bob", "repository": "default"})
-    wf = platform.create_workflow(PlanningWorkflow)
     issue = {
         "title": "Fix auth token leak",
         "labels": ["bug"],
@@ -45,9 +55,15 @@ def test_security_routing_and_assignment():
     assert data["assignee"] == "bob"
 
 
-def test_rank_issues():
-    platform = AutonomyPlatform()
-    wf = platform.create_workflow(PlanningWorkflow)
+def test_memory_reset(platform):
+    platform.memory.add({"team_members": "bob", "repository": "default"})
+    assert platform.memory.search("team_members") == "bob"
+    platform.memory.reset()
+    assert platform.memory.search("team_members") == ""
+    assert platform.memory.store == {}
+
+
+def test_rank_issues(wf):
     issues = [
         {
             "number": 1,
@@ -63,3 +79,60 @@ def test_rank_issues():
     ranked = wf.rank_issues(issues)
     assert [i["number"] for i in ranked] == [2, 1]
     assert "priority_score" in ranked[0]
+
+
+class DummyMemory:
+    def __init__(self):
+        self.added = []
+
+    def search(self, query, filter_metadata=None):
+        return ""
+
+    def add(self, data):
+        self.added.append(data)
+        return True
+
+
+class BatchLLM:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def complete_with_fallback(self, messages, models, operation="default"):
+        self.calls.append(operation)
+        return self.response
+
+
+def test_batched_llm_calls(monkeypatch):
+    llm = BatchLLM(
+        '```json\n{"analysis": "auth change", "tasks": ["a", "b"], "plan": "p"}\n```'
+    )
+    wf = PlanningWorkflow(
+        DummyMemory(), llm, None, None, PlanningConfig(batch_llm_calls=True)
+    )
+    monkeypatch.setattr(click, "confirm", lambda *a, **k: True)
+    data = wf.run({"title": "t", "labels": [], "repository": "default"}).state.data
+    assert llm.calls == ["analysis"]
+    assert data["analysis"] == "auth change"
+    assert data["tasks"] == ["a", "b"]
+    assert data["plan"] == "p"
+    assert data["requires_security_review"]
+
+
+def test_batched_llm_calls_fall_back_on_bad_json(monkeypatch):
+    llm = BatchLLM("x; y")
+    wf = PlanningWorkflow(
+        DummyMemory(), llm, None, None, PlanningConfig(batch_llm_calls=True)
+    )
+    monkeypatch.setattr(click, "confirm", lambda *a, **k: True)
+    data = wf.run({"title": "t", "labels": [], "repository": "default"}).state.data
+    assert llm.calls == ["analysis", "analysis", "decomposition", "planning"]
+    assert data["tasks"] == ["x", "y"]
+
+
+def test_route_keywords():
+    wf = PlanningWorkflow(DummyMemory(), None, None, None)
+    state = wf.route({"analysis": "Rotate AUTHENTICATION secrets"})
+    assert state["requires_security_review"]
+    assert not state["requires_docs"]
+    assert wf.route({"analysis": "New Public API"})["requires_docs"]
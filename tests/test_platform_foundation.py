@@ -1,3 +1,7 @@
+import threading
+
+import pytest
+
 from src.core.models import Issue, WorkflowState
 from src.core.platform import AutonomyPlatform, BaseWorkflow
 from src.planning.config import PlanningConfig
@@ -20,6 +24,42 @@ def test_platform_and_workflow():
     assert result.state.data["done"] is True
 
 
+class ParallelWorkflow(BaseWorkflow):
+    STEP_DEPS = {"a": (), "b": (), "c": ("a", "b")}
+
+    def _build_graph(self):
+        self.barrier = threading.Barrier(2, timeout=5)
+        return {"a": self.step_a, "b": self.step_b, "c": self.step_c}
+
+    def step_a(self, state):
+        self.barrier.wait()
+        state["a"] = 1
+        return state
+
+    def step_b(self, state):
+        self.barrier.wait()
+        state["b"] = 2
+        return state
+
+    def step_c(self, state):
+        state["c"] = state["a"] + state["b"]
+        return state
+
+
+def test_independent_steps_run_concurrently():
+    wf = ParallelWorkflow(None, None, None, None)
+    assert wf._step_waves() == [["a", "b"], ["c"]]
+    result = wf.execute({"x": 1})
+    assert result.state.data == {"x": 1, "a": 1, "b": 2, "c": 3}
+
+
+def test_cyclic_step_dependencies():
+    wf = ParallelWorkflow(None, None, None, None)
+    wf.STEP_DEPS = {"a": ("c",), "b": (), "c": ("a",)}
+    with pytest.raises(ValueError):
+        wf._step_waves()
+
+
 def test_models():
     issue = Issue(id="1", title="t", body="b")
     state = WorkflowState(issue_id="1")
@@ -1,7 +1,12 @@
 import os
 from datetime import datetime, timedelta, timezone
 
-from src.tasks.ranking import RankingConfig, RankingEngine
+from src.tasks.ranking import (
+    RankingConfig,
+    RankingEngine,
+    label_names,
+    parse_timestamp,
+)
 
 
 def _make_issue(num: int, prio: str, days: int = 0):
@@ -47,3 +52,55 @@ def test_load_weights_from_file(tmp_path):
         assert eng.config.weights["issue_age"] == 5.0
     finally:
         os.chdir(cwd)
+
+
+def test_label_names_and_precomputed_labels():
+    issue = {"labels": [{"name": "priority-high"}, "bug"]}
+    assert label_names(issue) == ("priority-high", "bug")
+    assert label_names({"labels": None}) == ()
+    eng = RankingEngine()
+    _, breakdown = eng.score_issue(issue, explain=True, labels=("priority-low",))
+    assert breakdown["priority"] == 1
+
+
+def test_score_uses_given_now():
+    eng = RankingEngine()
+    issue = _make_issue(6, "priority-low", 0)
+    later = datetime.now(timezone.utc) + timedelta(days=3)
+    _, breakdown = eng.score_issue(issue, explain=True, now=later)
+    assert breakdown["age_penalty"] == 3
+
+
+def test_parse_timestamp():
+    expected = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert parse_timestamp("2025-01-02T03:04:05Z") == expected
+    assert parse_timestamp("2025-01-02T03:04:05.5+00:00") > expected
+
+
+def test_min_score_skips_unreachable_issues():
+    eng = RankingEngine()
+    issue = _make_issue(7, "priority-low", 2)
+    assert eng.score_issue(issue, min_score=150) == float("-inf")
+    assert eng.score_issue(issue, min_score=50) == eng.score_issue(issue)
+
+
+def test_future_created_at_scores_as_new():
+    eng = RankingEngine()
+    issue = _make_issue(9, "priority-low", -10)
+    assert eng.score_issue(issue) == eng.score_issue(_make_issue(9, "priority-low"))
+    # The age never pushes a score above the pruning bound
+    assert eng.score_issue(issue, min_score=101) == float("-inf")
+
+
+def test_features_cached_per_issue_version():
+    eng = RankingEngine()
+    issue = _make_issue(8, "priority-low", 1)
+    issue["updated_at"] = "2025-01-01T00:00:00Z"
+    low = eng.score_issue(issue)
+    issue["labels"] = [{"name": "priority-high"}]
+    assert eng.score_issue(issue) == low
+    issue["updated_at"] = "2025-01-02T00:00:00Z"
+    assert eng.score_issue(issue) > low
+    issue["labels"] = [{"name": "blocked"}]
+    eng.clear_cache()
+    assert eng.score_issue(issue) == float("-inf")
@@ -1,5 +1,8 @@
+from types import SimpleNamespace
+
 import pytest
 
+import src.slack
 from src.slack import get_slack_auth_info
 
 
@@ -19,7 +22,9 @@ def test_get_slack_auth_info(monkeypatch):
         assert url == "https://slack.com/api/auth.test"
         return DummyResponse(data={"user": "u", "team": "workspace"})
 
-    monkeypatch.setattr("requests.post", dummy_post)
+    monkeypatch.setattr(
+        "src.slack._get_session", lambda: SimpleNamespace(post=dummy_post)
+    )
     info = get_slack_auth_info("token")
     assert info["user"] == "u"
     assert info["team"] == "workspace"
@@ -29,6 +34,15 @@ def test_get_slack_auth_info_error(monkeypatch):
     def dummy_post(url, headers=None, timeout=10):
         return DummyResponse(ok=False, data={"error": "bad_auth"})
 
-    monkeypatch.setattr("requests.post", dummy_post)
+    monkeypatch.setattr(
+        "src.slack._get_session", lambda: SimpleNamespace(post=dummy_post)
+    )
     with pytest.raises(ValueError):
         get_slack_auth_info("token")
+
+
+def test_slack_session_is_reused(monkeypatch):
+    monkeypatch.setattr("src.slack._session", None)
+    session = src.slack._get_session()
+    assert src.slack._get_session() is session
+    assert session.get_adapter("https://slack.com").max_retries.total == 2
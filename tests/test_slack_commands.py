@@ -1,6 +1,5 @@
-from pathlib import Path
+import pytest
 
-from src.core.secret_vault import SecretVault
 from src.slack.commands import SlashCommandHandler
 from src.slack.mapping import SlackGitHubMapper
 
@@ -31,20 +30,30 @@ class DummyTM:
         return True
 
 
-def test_slack_github_mapper(tmp_path):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
+@pytest.fixture
+def mapper(tmp_path, vault):
+    """Return a mapper storing ``U`` -> ``gh`` under ``tmp_path``."""
     mapper = SlackGitHubMapper(vault)
     mapper.mapping_file = tmp_path / "m.json"
     mapper.set_mapping("U", "gh")
+    return mapper
+
+
+def test_slack_github_mapper(mapper):
     assert mapper.get_github_user("U") == "gh"
     assert mapper.get_github_user("X") == "X"
 
 
-def test_slash_next_with_mapping(tmp_path):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
-    mapper = SlackGitHubMapper(vault)
-    mapper.mapping_file = tmp_path / "m.json"
+def test_mapper_recreates_removed_directory(mapper, tmp_path):
+    mapper.mapping_file = tmp_path / "sub" / "m.json"
     mapper.set_mapping("U", "gh")
+    mapper.mapping_file.unlink()
+    mapper.mapping_file.parent.rmdir()
+    mapper.set_mapping("U", "gh2")
+    assert mapper.get_github_user("U") == "gh2"
+
+
+def test_slash_next_with_mapping(mapper):
     handler = SlashCommandHandler(DummyTM(), mapper)
     resp = handler.handle_command("/autonomy next", {"user_id": "U"})
     assert resp["response_type"] == "ephemeral"
@@ -52,6 +61,30 @@ def test_slash_next_with_mapping(tmp_path):
     assert resp["blocks"][0]["type"] == "section"
 
 
+def test_slash_user_mapping_cached():
+    class CountingMapper:
+        calls = 0
+
+        def get_github_user(self, slack_user):
+            self.calls += 1
+            return "gh"
+
+    mapper = CountingMapper()
+    handler = SlashCommandHandler(DummyTM(), mapper)
+    handler.handle_command("/autonomy next", {"user_id": "U"})
+    handler.handle_command("/autonomy status", {"user_id": "U"})
+    assert mapper.calls == 1
+    handler.USER_CACHE_TTL = 0
+    handler.handle_command("/autonomy next", {"user_id": "U"})
+    assert mapper.calls == 2
+
+
+def test_slash_unknown_command_shows_help():
+    handler = SlashCommandHandler(DummyTM())
+    resp = handler.handle_command("/autonomy bogus", {})
+    assert resp["text"].startswith("Available commands")
+
+
 def test_slash_update_success(tmp_path):
     handler = SlashCommandHandler(DummyTM())
     resp = handler.handle_command("/autonomy update", {"text": "1", "user": "U"})
@@ -64,26 +97,20 @@ def test_slash_update_usage(tmp_path):
     assert "Usage" in resp["text"]
 
 
-def test_slash_status(tmp_path):
-    vault = SecretVault(vault_path=tmp_path / "v.json", key_path=tmp_path / "k.key")
-    mapper = SlackGitHubMapper(vault)
-    mapper.mapping_file = tmp_path / "m.json"
-    mapper.set_mapping("U", "gh")
+def test_slash_status(mapper):
     handler = SlashCommandHandler(DummyTM(), mapper)
     resp = handler.handle_command("/autonomy status", {"user_id": "U"})
     assert resp["response_type"] == "ephemeral"
     assert resp["blocks"][1]["type"] == "fields"
+    assert resp["blocks"][1]["fields"][1]["text"] == "*In Progress:* 1"
 
 
-def test_slash_undo(tmp_path: Path):
-    from src.audit.logger import AuditLogger
-
+def test_slash_undo(audit_logger):
     tm = DummyTM()
     tm.issue_manager = tm  # type: ignore[attr-defined]
-    logger = AuditLogger(tmp_path / "audit.log")
-    tm.audit_logger = logger
+    tm.audit_logger = audit_logger
 
-    h = logger.log(
+    h = audit_logger.log(
         "update_labels", {"issue": 1, "add_labels": ["a"], "remove_labels": None}
     )
     handler = SlashCommandHandler(tm)
@@ -91,13 +118,12 @@ def test_slash_undo(tmp_path: Path):
     assert "Undo" in resp["text"]
 
 
-def test_slash_undo_window(tmp_path: Path):
-    from src.audit.logger import AuditLogger
+def test_slash_undo_window(audit_logger):
     from src.core.config import WorkflowConfig
 
     tm = DummyTM()
     tm.issue_manager = tm  # type: ignore[attr-defined]
-    tm.audit_logger = AuditLogger(tmp_path / "audit.log")
+    tm.audit_logger = audit_logger
     tm.config = WorkflowConfig(commit_window=2)
     h = tm.audit_logger.log(
         "update_labels", {"issue": 1, "add_labels": ["a"], "remove_labels": None}
@@ -107,30 +133,25 @@ def test_slash_undo_window(tmp_path: Path):
     assert "window=2" in resp["text"]
 
 
-def test_slash_undo_invalid(tmp_path: Path) -> None:
+def test_slash_undo_invalid(audit_logger) -> None:
     tm = DummyTM()
     tm.issue_manager = tm  # type: ignore[attr-defined]
-    tm.audit_logger = __import__(
-        "src.audit.logger", fromlist=["AuditLogger"]
-    ).AuditLogger(tmp_path / "log.json")
+    tm.audit_logger = audit_logger
     handler = SlashCommandHandler(tm)
     resp = handler.handle_command("/autonomy undo", {"text": "bad-hash"})
     assert "Usage" in resp["text"]
 
 
-def test_slash_undo_not_found(tmp_path: Path) -> None:
-    from src.audit.logger import AuditLogger
-
+def test_slash_undo_not_found(audit_logger) -> None:
     tm = DummyTM()
     tm.issue_manager = tm  # type: ignore[attr-defined]
-    tm.audit_logger = AuditLogger(tmp_path / "log.json")
+    tm.audit_logger = audit_logger
     handler = SlashCommandHandler(tm)
     resp = handler.handle_command("/autonomy undo", {"text": "deadbeef"})
     assert "not found" in resp["text"]
 
 
-def test_slash_undo_notification(tmp_path: Path) -> None:
-    from src.audit.logger import AuditLogger
+def test_slash_undo_notification(audit_logger) -> None:
     from src.slack.notifications import SystemNotifier
 
     class DummyNotifier(SystemNotifier):
@@ -143,7 +164,7 @@ def test_slash_undo_notification(tmp_path: Path) -> None:
 
     tm = DummyTM()
     tm.issue_manager = tm  # type: ignore[attr-defined]
-    tm.audit_logger = AuditLogger(tmp_path / "log.json")
+    tm.audit_logger = audit_logger
     tm.system_notifier = DummyNotifier()
 
     h = tm.audit_logger.log(
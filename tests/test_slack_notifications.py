@@ -1,5 +1,8 @@
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 
+import pytest
+
 from src.slack.notifications import (
     BacklogDoctorNotifier,
     BacklogFindings,
@@ -60,6 +63,9 @@ def test_system_notifier():
     op = UndoOperation("Did stuff", "me", "h")
     assert sysn.send_undo_confirmation("C", op)
     assert bot.calls
+    assert not hasattr(op, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        op.actor = "other"  # type: ignore[misc]
 
 
 def test_notification_scheduler():
@@ -42,6 +42,7 @@ def test_get_next_task(monkeypatch, tmp_path):
     issues = [_make_issue(1, "priority-low", 5), _make_issue(2, "priority-high", 1)]
     dummy = DummyIssueManager(issues)
     tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
     tm.issue_manager = dummy
     tm.pinned_store = PinnedItemsStore(config_dir=tmp_path)
     tm.project_id = "o/r"
@@ -64,6 +65,7 @@ def test_get_next_task_explain(monkeypatch, tmp_path):
     issues = [_make_issue(1, "priority-low", 0)]
     dummy = DummyIssueManager(issues)
     tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
     tm.issue_manager = dummy
     tm.pinned_store = PinnedItemsStore(config_dir=tmp_path)
     tm.project_id = "o/r"
@@ -79,6 +81,7 @@ def test_get_next_task_explain(monkeypatch, tmp_path):
 def test_update_task(monkeypatch):
     dummy = DummyIssueManager([])
     tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
     tm.issue_manager = dummy
     from src.tasks.ranking import RankingEngine
 
@@ -99,6 +102,7 @@ def test_get_next_task_none(monkeypatch, tmp_path):
     ]
     dummy = DummyIssueManager(issues)
     tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
     tm.issue_manager = dummy
     tm.pinned_store = PinnedItemsStore(config_dir=tmp_path)
     tm.project_id = "o/r"
@@ -115,6 +119,7 @@ def test_list_tasks(monkeypatch, tmp_path):
     ]
     dummy = DummyIssueManager(issues)
     tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
     tm.issue_manager = dummy
     tm.pinned_store = PinnedItemsStore(config_dir=tmp_path)
     tm.project_id = "o/r"
@@ -123,11 +128,156 @@ def test_list_tasks(monkeypatch, tmp_path):
     tm.ranking = RankingEngine()
     tasks = tm.list_tasks()
     assert [t["number"] for t in tasks] == [2, 1]
+    assert [t["number"] for t in tm.list_tasks(limit=1)] == [2]
+    dummy._issues.extend(
+        [_make_issue(3, "priority-high", 5), _make_issue(4, "priority-low")]
+    )
+    tm.invalidate_issues()
+    assert [t["number"] for t in tm.list_tasks(limit=3)] == [2, 3, 1]
+
+
+def test_list_tasks_filters(tmp_path):
+    first = _make_issue(1, "priority-high")
+    first["assignee"] = {"login": "alice"}
+    first["labels"].append("Team:Core")
+    second = _make_issue(2, "priority-high")
+    second["assignees"] = [None, {"login": "bob"}]
+    tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
+    tm.issue_manager = DummyIssueManager([first, second])
+    tm.pinned_store = PinnedItemsStore(config_dir=tmp_path)
+    tm.project_id = "o/r"
+    from src.tasks.ranking import RankingEngine
+
+    tm.ranking = RankingEngine()
+    assert [t["number"] for t in tm.list_tasks(assignee="bob")] == [2]
+    assert [t["number"] for t in tm.list_tasks(team="core")] == [1]
+    assert tm.list_tasks(assignee="bob", team="core") == []
+
+
+def test_open_issues_cached_until_update(tmp_path):
+    class CountingIM(DummyIssueManager):
+        calls = 0
+
+        def list_issues(self, state="open"):
+            self.calls += 1
+            return super().list_issues(state)
+
+    dummy = CountingIM([_make_issue(1, "priority-high")])
+    tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
+    tm.issue_manager = dummy
+    tm.pinned_store = PinnedItemsStore(config_dir=tmp_path)
+    tm.project_id = "o/r"
+    from src.tasks.ranking import RankingEngine
+
+    tm.ranking = RankingEngine()
+    tm.sync_cooldown = 60
+    tm._last_sync = time.monotonic()
+    tm.get_next_task()
+    tm.list_tasks()
+    assert dummy.calls == 1
+    tm.update_task(1, status="in-progress")
+    tm._sync_timer.cancel()
+    tm.list_tasks()
+    assert dummy.calls == 2
+
+
+def test_open_issues_revalidated_with_etag(tmp_path):
+    class ConditionalIM(DummyIssueManager):
+        etags = []
+
+        def list_issues_conditional(self, state="open", etag=None):
+            self.etags.append(etag)
+            if etag == "v1":
+                return 304, etag, []
+            return 200, "v1", self._issues
+
+    dummy = ConditionalIM([_make_issue(1, "priority-high")])
+    tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
+    tm.issue_manager = dummy
+    tm.pinned_store = PinnedItemsStore(config_dir=tmp_path)
+    tm.project_id = "o/r"
+    from src.tasks.ranking import RankingEngine
+
+    tm.ranking = RankingEngine()
+    tm.issues_ttl = 0
+    assert [t["number"] for t in tm.list_tasks()] == [1]
+    assert [t["number"] for t in tm.list_tasks()] == [1]
+    assert dummy.etags == [None, "v1"]
+
+
+def test_open_issues_failed_fetch_not_cached():
+    class FlakyIM(DummyIssueManager):
+        responses = [(200, "v1"), (503, "v1"), (0, None), (200, "v2")]
+        etags = []
+
+        def list_issues_conditional(self, state="open", etag=None):
+            self.etags.append(etag)
+            status, new_etag = self.responses.pop(0)
+            return status, new_etag, self._issues if status == 200 else []
+
+    dummy = FlakyIM([_make_issue(1, "priority-high")])
+    tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
+    tm.issue_manager = dummy
+    tm.issues_ttl = 0
+    assert tm._open_issues() == dummy._issues
+    assert tm._open_issues() == dummy._issues
+    assert tm._open_issues() == dummy._issues
+    assert tm._open_issues() == dummy._issues
+    assert dummy.etags == [None, "v1", "v1", "v1"]
+
+    tm.invalidate_issues()
+    dummy.responses = [(403, None)]
+    assert tm._open_issues() == []
+    assert tm._issues_cache is None
+
+
+def test_open_issues_empty_list_not_cached():
+    class CountingIM(DummyIssueManager):
+        calls = 0
+
+        def list_issues(self, state="open"):
+            self.calls += 1
+            return super().list_issues(state)
+
+    dummy = CountingIM([])
+    tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
+    tm.issue_manager = dummy
+    assert tm._open_issues() == []
+    assert tm._open_issues() == []
+    assert dummy.calls == 2
+
+
+def test_list_tasks_concurrent_scoring(tmp_path):
+    issues = [_make_issue(n, "priority-low", n) for n in range(1, 5)]
+    issues[2]["labels"] = [{"name": "priority-high"}]
+    tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
+    tm.issue_manager = DummyIssueManager(issues)
+    tm.pinned_store = PinnedItemsStore(config_dir=tmp_path)
+    tm.project_id = "o/r"
+    from src.tasks.ranking import RankingEngine
+
+    engine = RankingEngine()
+
+    def score_issue(issue, **kwargs):
+        if issue["number"] == 4:
+            raise RuntimeError("boom")
+        return engine.score_issue(issue, **kwargs)
+
+    tm.ranking = SimpleNamespace(score_issue=score_issue)
+    tm.ranking_max_workers = 3
+    assert [t["number"] for t in tm.list_tasks()] == [3, 1, 2]
 
 
 def test_update_task_rollover(monkeypatch):
     dummy = DummyIssueManager([])
     tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
     tm.issue_manager = dummy
     from src.tasks.ranking import RankingEngine
 
@@ -148,6 +298,7 @@ def test_update_task_rollover(monkeypatch):
 def test_update_task_triggers_sync(monkeypatch):
     dummy = DummyIssueManager([])
     tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
     tm.issue_manager = dummy
     from src.tasks.ranking import RankingEngine
 
@@ -177,13 +328,16 @@ def test_update_task_triggers_sync(monkeypatch):
 def test_sync_debounce(monkeypatch):
     dummy = DummyIssueManager([])
     tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
     tm.issue_manager = dummy
     from src.tasks.ranking import RankingEngine
 
     tm.ranking = RankingEngine()
     tm.sync_cooldown = 5
-    tm._last_sync = time.time()
-    tm.audit_logger = None
+    tm._last_sync = time.monotonic()
+    tm.project_id = "o/r"
+    logged = []
+    tm.audit_logger = SimpleNamespace(log=lambda op, data: logged.append(data))
 
     called = {}
 
@@ -200,11 +354,31 @@ def test_sync_debounce(monkeypatch):
         "threading.Thread",
         lambda target, daemon=False: SimpleNamespace(start=lambda: target()),
     )
-    tm._trigger_sync()
+    timers = []
+
+    class FakeTimer:
+        def __init__(self, interval, function):
+            self.interval = interval
+            self.function = function
+            timers.append(self)
+
+        def start(self):
+            pass
+
+    monkeypatch.setattr("threading.Timer", FakeTimer)
+    tm._trigger_sync("webhook:issues")
+    tm._trigger_sync("webhook:override")
     assert called.get("count", 0) == 0
-    tm._last_sync = time.time() - 6
-    tm._trigger_sync()
+    assert len(timers) == 1 and 0 < timers[0].interval <= 5
+    timers[0].function()
     assert called.get("count", 0) == 1
+    assert logged[0]["reasons"] == ["webhook:issues", "webhook:override"]
+    assert tm._sync_timer is None
+    tm._last_sync = time.monotonic() - 6
+    hierarchy = tm._hierarchy
+    tm._trigger_sync()
+    assert called.get("count", 0) == 2
+    assert tm._hierarchy is hierarchy
 
 
 def test_pinned_items_skipped(tmp_path):
@@ -213,6 +387,7 @@ def test_pinned_items_skipped(tmp_path):
     store = PinnedItemsStore(config_dir=tmp_path)
     store.pin_item("o/r", "1")
     tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
     tm.issue_manager = dummy
     tm.pinned_store = store
     tm.project_id = "o/r"
@@ -220,3 +395,31 @@ def test_pinned_items_skipped(tmp_path):
 
     tm.ranking = RankingEngine()
     assert tm.get_next_task() is None
+
+
+def test_pinned_store_read_once_per_query(tmp_path, monkeypatch):
+    issues = [_make_issue(i, "priority-high", 0) for i in range(1, 4)]
+    store = PinnedItemsStore(config_dir=tmp_path)
+    store.pin_item("o/r", "2")
+    reads = []
+    load = store.load_pinned_items
+    monkeypatch.setattr(store, "load_pinned_items", lambda: reads.append(1) or load())
+    tm = TaskManager.__new__(TaskManager)
+    tm._init_state()
+    tm.issue_manager = DummyIssueManager(issues)
+    tm.pinned_store = store
+    tm.project_id = "o/r"
+    from src.tasks.ranking import RankingEngine
+
+    tm.ranking = RankingEngine()
+    assert [i["number"] for i in tm.list_tasks()] == [1, 3]
+    assert len(reads) == 1
+
+
+def test_sync_state_is_per_instance():
+    a = TaskManager.__new__(TaskManager)
+    a._init_state()
+    b = TaskManager.__new__(TaskManager)
+    b._init_state()
+    assert a._sync_lock is not b._sync_lock
+    assert "_sync_lock" not in vars(TaskManager)
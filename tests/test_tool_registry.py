@@ -1,8 +1,5 @@
-from pathlib import Path
-
 import pytest
 
-from src.audit.logger import AuditLogger
 from src.tools import ToolRegistry
 
 
@@ -21,8 +18,8 @@ class DummyAgent:
         self.permissions = permissions
 
 
-def test_permission_enforcement(tmp_path: Path) -> None:
-    registry = ToolRegistry(audit_logger=AuditLogger(tmp_path / "audit.log"))
+def test_permission_enforcement(audit_logger) -> None:
+    registry = ToolRegistry(audit_logger=audit_logger)
     tool = DummyTool()
     registry.register_tool("dummy", tool, permission="write")
     agent = DummyAgent("a1", ["read"])
@@ -30,8 +27,8 @@ def test_permission_enforcement(tmp_path: Path) -> None:
         registry.execute_tool("dummy", "do", agent=agent, params={"value": 1})
 
 
-def test_audit_logging(tmp_path: Path) -> None:
-    registry = ToolRegistry(audit_logger=AuditLogger(tmp_path / "audit.log"))
+def test_audit_logging(audit_logger) -> None:
+    registry = ToolRegistry(audit_logger=audit_logger)
     tool = DummyTool()
     registry.register_tool("dummy", tool, permission="write")
     agent = DummyAgent("a2", ["write"])
@@ -45,8 +42,8 @@ def test_audit_logging(tmp_path: Path) -> None:
     assert entry["details"]["success"] is True
 
 
-def test_admin_permission_and_error_logging(tmp_path: Path) -> None:
-    registry = ToolRegistry(audit_logger=AuditLogger(tmp_path / "audit.log"))
+def test_admin_permission_and_error_logging(audit_logger) -> None:
+    registry = ToolRegistry(audit_logger=audit_logger)
 
     class FailingTool:
         def do(self) -> None:
@@ -1,11 +1,17 @@
-import hashlib
+import asyncio
+import functools
 import hmac
+import io
 import json
 from pathlib import Path
+from types import SimpleNamespace
 
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
 from src.api import create_app
+from src.api.webhooks import OverrideStore, verify_signature
 from src.audit.logger import AuditLogger
 
 
@@ -15,57 +21,128 @@ class DummyIssueManager:
         self.repo = "r"
 
 
+@functools.lru_cache(maxsize=128)
 def _sign(secret: str, body: bytes) -> str:
-    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
-    return "sha256=" + digest
+    return "sha256=" + hmac.digest(secret.encode(), body, "sha256").hex()
 
 
-def test_github_webhook(tmp_path: Path) -> None:
-    secret = "s3"
-    overrides = tmp_path / "ovr.log"
-    log = tmp_path / "log"
+_CANON_BODY = json.dumps(
+    {"action": "edited", "issue": {"number": 1}}, separators=(",", ":")
+).encode()
+_CANON_SIG = _sign("s3", _CANON_BODY)
+
+
+@pytest.fixture(scope="module")
+def webhook_env(tmp_path_factory):
+    """One app, with routes and validators warmed, shared by the module."""
+    d = tmp_path_factory.mktemp("wh")
+    overrides = d / "ovr.log"
+    audit = AuditLogger(d / "log", overrides_path=overrides)
     app = create_app(
         DummyIssueManager(),
-        AuditLogger(log),
-        webhook_secret=secret,
+        audit,
+        webhook_secret="s3",
         overrides_path=overrides,
     )
     client = TestClient(app)
+    client.get("/openapi.json")
+    return SimpleNamespace(client=client, overrides=overrides, audit=audit)
 
-    payload = {"action": "edited", "issue": {"number": 1}}
-    body = json.dumps(payload).encode()
-    headers = {
-        "X-Hub-Signature-256": _sign(secret, body),
-        "X-GitHub-Event": "issues",
-    }
-    r = client.post("/webhook/github", data=body, headers=headers)
+
+@pytest.fixture
+def webhook(webhook_env):
+    """Return the shared webhook app with empty override and audit logs."""
+    webhook_env.overrides.write_text("")
+    webhook_env.audit.clear()
+    return webhook_env
+
+
+def test_github_webhook(webhook) -> None:
+    headers = {"X-Hub-Signature-256": _CANON_SIG, "X-GitHub-Event": "issues"}
+    r = webhook.client.post("/webhook/github", content=_CANON_BODY, headers=headers)
     assert r.status_code == 200
-    data = overrides.read_text().strip().splitlines()
+    data = webhook.overrides.read_text().strip().splitlines()
     assert len(data) == 1
     entry = json.loads(data[0])
     assert entry["event"] == "issues"
     assert entry["payload"]["action"] == "edited"
-    logs = list(AuditLogger(log).iter_logs())
+    logs = list(webhook.audit.iter_logs())
     assert logs and logs[0]["operation"] == "github_webhook"
 
 
-def test_webhook_bad_signature(tmp_path: Path) -> None:
-    secret = "s3"
-    overrides = tmp_path / "ovr.log"
-    app = create_app(
-        DummyIssueManager(),
-        AuditLogger(tmp_path / "log"),
-        webhook_secret=secret,
-        overrides_path=overrides,
-    )
-    client = TestClient(app)
-    body = b"{}"
-    r = client.post(
-        "/webhook/github", data=body, headers={"X-Hub-Signature-256": "wrong"}
+def test_github_webhook_stores_raw_body_on_one_line(webhook) -> None:
+    body = json.dumps({"action": "opened", "title": "caf\u00e9"}, indent=2).encode()
+    headers = {"X-Hub-Signature-256": _sign("s3", body), "X-GitHub-Event": "issues"}
+    r = webhook.client.post("/webhook/github", content=body, headers=headers)
+    assert r.status_code == 200
+    (line,) = webhook.overrides.read_text(encoding="utf-8").splitlines()
+    entry = json.loads(line)
+    assert entry["payload"] == {"action": "opened", "title": "caf\u00e9"}
+    assert entry["event"] == "issues" and entry["timestamp"]
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "utf-32-le"])
+def test_github_webhook_non_utf8_body_stored_as_json(webhook, encoding) -> None:
+    body = json.dumps({"action": "opened"}).encode(encoding)
+    headers = {"X-Hub-Signature-256": _sign("s3", body), "X-GitHub-Event": "issues"}
+    r = webhook.client.post("/webhook/github", content=body, headers=headers)
+    assert r.status_code == 200
+    (line,) = webhook.overrides.read_text(encoding="utf-8").splitlines()
+    assert json.loads(line)["payload"] == {"action": "opened"}
+
+
+def test_overrides_webhook_bom_body_stored_as_json(webhook) -> None:
+    body = json.dumps({"field": "priority"}).encode("utf-8-sig")
+    r = webhook.client.post("/webhook/overrides", content=body)
+    assert r.status_code == 200
+    (line,) = webhook.overrides.read_text(encoding="utf-8").splitlines()
+    assert json.loads(line)["payload"] == {"field": "priority"}
+
+
+@pytest.mark.parametrize(
+    "sig",
+    [
+        "wrong",
+        _sign("other", _CANON_BODY),
+        _CANON_SIG.replace("sha256=", ""),
+        _CANON_SIG.replace("sha256=", "sha1="),
+        _CANON_SIG[:-2],
+        _CANON_SIG[:-2] + "zz",
+        _CANON_SIG.upper().replace("SHA256=", "sha256="),
+        _CANON_SIG[:9] + " " + _CANON_SIG[9:],
+        _CANON_SIG + " ",
+        None,
+    ],
+)
+def test_verify_signature_rejects(sig) -> None:
+    # Checked directly; test_webhook_bad_signature covers the HTTP 400 path
+    assert not verify_signature("s3", _CANON_BODY, sig)
+
+
+def test_verify_signature_accepts() -> None:
+    assert verify_signature("s3", _CANON_BODY, _CANON_SIG)
+    assert verify_signature("", _CANON_BODY, None)
+
+
+def test_webhook_bad_signature(webhook) -> None:
+    r = webhook.client.post(
+        "/webhook/github", content=_CANON_BODY, headers={"X-Hub-Signature-256": "bad"}
     )
     assert r.status_code == 400
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_override_store_add(tmp_path: Path, monkeypatch, use_orjson) -> None:
+    if not use_orjson:
+        monkeypatch.setattr("src.api.webhooks.orjson", None)
+    store = OverrideStore(tmp_path / "ovr.log")
+    store.add("override", {"field": "priority", "value": "h\u00f6ch"})
+    (line,) = store.path.read_text(encoding="utf-8").splitlines()
+    entry = json.loads(line)
+    assert entry["payload"] == {"field": "priority", "value": "h\u00f6ch"}
+    assert entry["event"] == "override"
+
+
 def test_webhook_rate_limit(tmp_path: Path) -> None:
     secret = "s3"
     overrides = tmp_path / "ovr.log"
@@ -77,61 +154,80 @@ def test_webhook_rate_limit(tmp_path: Path) -> None:
         webhook_rate_limit=2,
     )
     client = TestClient(app)
-    body = json.dumps({}).encode()
+    # Signed once; the limiter only sees repeated identical requests
+    body = b"{}"
     headers = {"X-Hub-Signature-256": _sign(secret, body)}
-    assert client.post("/webhook/github", data=body, headers=headers).status_code == 200
-    assert client.post("/webhook/github", data=body, headers=headers).status_code == 200
-    assert client.post("/webhook/github", data=body, headers=headers).status_code == 429
+    statuses = [
+        client.post("/webhook/github", content=body, headers=headers).status_code
+        for _ in range(3)
+    ]
+    assert statuses == [200, 200, 429]
 
 
-def test_webhook_triggers_sync(tmp_path: Path, monkeypatch) -> None:
-    secret = "s3"
+@pytest.mark.asyncio
+async def test_webhook_burst(tmp_path: Path) -> None:
     overrides = tmp_path / "ovr.log"
-    log = tmp_path / "log"
+    count = 20
+    app = create_app(
+        DummyIssueManager(),
+        AuditLogger(io.StringIO()),
+        webhook_secret="s3",
+        overrides_path=overrides,
+        webhook_rate_limit=count,
+    )
+    bodies = [
+        json.dumps({"action": "opened", "issue": {"number": n}}).encode()
+        for n in range(count)
+    ]
+    requests = [
+        (body, {"X-Hub-Signature-256": _sign("s3", body), "X-GitHub-Event": "issues"})
+        for body in bodies
+    ]
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as ac:
+        responses = await asyncio.gather(
+            *(
+                ac.post("/webhook/github", content=body, headers=headers)
+                for body, headers in requests
+            )
+        )
+    assert [r.status_code for r in responses] == [200] * count
+    lines = overrides.read_text().splitlines()
+    numbers = sorted(json.loads(line)["payload"]["issue"]["number"] for line in lines)
+    assert numbers == list(range(count))
+
+
+def test_webhook_triggers_sync(webhook, monkeypatch) -> None:
     called = {}
 
-    def fake_sync(self):
+    def fake_sync(self, reason=None):
         called.setdefault("count", 0)
         called["count"] += 1
+        called["reason"] = reason
 
     monkeypatch.setattr(
         "src.tasks.task_manager.TaskManager._trigger_sync",
         fake_sync,
     )
-    app = create_app(
-        DummyIssueManager(),
-        AuditLogger(log),
-        webhook_secret=secret,
-        overrides_path=overrides,
-    )
-    client = TestClient(app)
     payload = {"action": "labeled", "issue": {"number": 1}}
     body = json.dumps(payload).encode()
     headers = {
-        "X-Hub-Signature-256": _sign(secret, body),
+        "X-Hub-Signature-256": _sign("s3", body),
         "X-GitHub-Event": "issues",
     }
-    assert client.post("/webhook/github", data=body, headers=headers).status_code == 200
+    r = webhook.client.post("/webhook/github", content=body, headers=headers)
+    assert r.status_code == 200
     assert called.get("count", 0) == 1
+    assert called["reason"] == "webhook:issues"
 
 
-def test_overrides_webhook(tmp_path: Path) -> None:
-    overrides = tmp_path / "ovr.log"
-    log = tmp_path / "log"
-    app = create_app(
-        DummyIssueManager(),
-        AuditLogger(log, overrides_path=overrides),
-        overrides_path=overrides,
-    )
-    client = TestClient(app)
-
+def test_overrides_webhook(webhook) -> None:
     payload = {"field": "priority", "value": "high"}
-    resp = client.post("/webhook/overrides", json=payload)
+    resp = webhook.client.post("/webhook/overrides", json=payload)
     assert resp.status_code == 200
-    data = overrides.read_text().strip().splitlines()
+    data = webhook.overrides.read_text().strip().splitlines()
     assert len(data) == 1
     entry = json.loads(data[0])
     assert entry["event"] == "override"
     assert entry["payload"]["field"] == "priority"
-    logger = AuditLogger(log, overrides_path=overrides)
-    assert logger.count_human_overrides() == 1
+    assert webhook.audit.count_human_overrides() == 1